@@ -1,10 +1,11 @@
 """Lost Soul system for character persistence after death."""
 
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Achievement:
     """Represents an achievement/badge earned by a character."""
 
@@ -15,7 +16,7 @@ class Achievement:
     bonus_value: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LostSoul:
     """Represents a dead character's soul with earned achievements."""
 
@@ -23,12 +24,24 @@ class LostSoul:
     level: int
     death_floor: int
     death_message: str
-    soul_badges: List[Achievement]
+    soul_badges: Tuple[Achievement, ...]
     total_play_time: float  # in seconds
     monsters_killed: int
     floors_cleared: int
 
 
+@lru_cache(maxsize=None)
+def _badge(
+    badge_id: str, name: str, description: str, bonus_type: str, bonus_value: int
+) -> Achievement:
+    """Return the shared Achievement instance for a badge definition.
+
+    Achievements are frozen, so every soul earning the same badge can hold
+    the same object instead of its own copy.
+    """
+    return Achievement(badge_id, name, description, bonus_type, bonus_value)
+
+
 class SoulSystem:
     """Manages Lost Soul mechanics and badge transfers."""
 
@@ -130,7 +143,7 @@ class SoulSystem:
         monsters_killed: int,
         floors_cleared: int,
         play_time: float,
-    ) -> List[Achievement]:
+    ) -> Tuple[Achievement, ...]:
         """Calculate badges earned from this character's achievements.
 
         Args:
@@ -141,15 +154,15 @@ class SoulSystem:
             play_time: Total play time in seconds
 
         Returns:
-            List of earned achievements
+            Tuple of earned achievements
         """
-        badges = []
+        badges: List[Achievement] = []
 
         # Level-based badges
         if level >= 10:
             badges.append(
-                Achievement(
-                    id="veteran_soul",
+                _badge(
+                    badge_id="veteran_soul",
                     name="Veteran Soul",
                     description="Reached level 10",
                     bonus_type="hp",
@@ -158,8 +171,8 @@ class SoulSystem:
             )
         if level >= 25:
             badges.append(
-                Achievement(
-                    id="experienced_soul",
+                _badge(
+                    badge_id="experienced_soul",
                     name="Experienced Soul",
                     description="Reached level 25",
                     bonus_type="stamina",
@@ -170,8 +183,8 @@ class SoulSystem:
         # Floor-based badges
         if death_floor >= 10:
             badges.append(
-                Achievement(
-                    id="deep_delver",
+                _badge(
+                    badge_id="deep_delver",
                     name="Deep Delver",
                     description="Reached floor 10",
                     bonus_type="defense",
@@ -182,8 +195,8 @@ class SoulSystem:
         # Combat badges
         if monsters_killed >= 100:
             badges.append(
-                Achievement(
-                    id="monster_slayer",
+                _badge(
+                    badge_id="monster_slayer",
                     name="Monster Slayer",
                     description="Killed 100 monsters",
                     bonus_type="attack",
@@ -195,8 +208,8 @@ class SoulSystem:
         hours_played = play_time / 3600
         if hours_played >= 5:
             badges.append(
-                Achievement(
-                    id="dedicated_soul",
+                _badge(
+                    badge_id="dedicated_soul",
                     name="Dedicated Soul",
                     description="Played for 5+ hours",
                     bonus_type="experience_rate",
@@ -204,9 +217,9 @@ class SoulSystem:
                 )
             )
 
-        return badges
+        return tuple(badges)
 
-    def _update_account_badges(self, new_badges: List[Achievement]) -> None:
+    def _update_account_badges(self, new_badges: Tuple[Achievement, ...]) -> None:
         """Update account-wide badge collection.
 
         Args:
@@ -228,10 +241,14 @@ class SoulSystem:
             return ["No souls have yet passed through these halls..."]
 
         lines = ["=== Lost Soul Memorial ===", ""]
-        for soul in self.lost_souls[-5:]:  # Show last 5 souls
-            lines.append(f"{soul.character_name} (Level {soul.level})")
-            lines.append(f"  {soul.death_message}")
-            lines.append(f"  Floor {soul.death_floor}")
-            lines.append("")
-
+        lines.extend(
+            line
+            for soul in self.lost_souls[-5:]  # Show last 5 souls
+            for line in (
+                f"{soul.character_name} (Level {soul.level})",
+                f"  {soul.death_message}",
+                f"  Floor {soul.death_floor}",
+                "",
+            )
+        )
         return lines
@@ -29,10 +29,10 @@ class TestLostSoul:
 
     def test_lost_soul_creation(self):
         """Test creating a Lost Soul."""
-        badges = [
+        badges = (
             Achievement("badge1", "Badge 1", "Test", "hp", 5),
             Achievement("badge2", "Badge 2", "Test", "attack", 2),
-        ]
+        )
 
         soul = LostSoul(
             character_name="Fallen Hero",
@@ -108,6 +108,13 @@ class TestSoulSystem:
         badge_ids = {badge.id for badge in soul.soul_badges}
         assert "dedicated_soul" in badge_ids
 
+    def test_death_badges_are_shared(self, soul_system):
+        """Test identical badges earned by different souls share one instance."""
+        soul1 = soul_system.create_lost_soul("Hero1", 10, 5, "Died", 3600.0, 50, 4)
+        soul2 = soul_system.create_lost_soul("Hero2", 12, 5, "Died", 3600.0, 50, 4)
+        assert isinstance(soul1.soul_badges, tuple)
+        assert soul1.soul_badges[0] is soul2.soul_badges[0]
+
     def test_account_badge_accumulation(self, soul_system):
         """Test badges accumulate across characters."""
         # First character earns veteran badge
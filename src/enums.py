@@ -1,23 +1,34 @@
 """Core enumerations for Ascendant: The Eternal Spire."""
 
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
 
-class TileType(Enum):
-    """Types of tiles that can exist in the game world."""
+class TileType(IntEnum):
+    """Types of tiles that can exist in the game world.
 
-    FLOOR = auto()
-    WALL = auto()
-    STAIRS_UP = auto()
-    STAIRS_DOWN = auto()
-    TRAP = auto()
-    CHEST = auto()
+    Each member is a single bit so groups of tile types can be tested with
+    one integer AND against the masks below.
+    """
+
+    FLOOR = 1 << 0
+    WALL = 1 << 1
+    STAIRS_UP = 1 << 2
+    STAIRS_DOWN = 1 << 3
+    TRAP = 1 << 4
+    CHEST = 1 << 5
 
     def __str__(self) -> str:
         """Return a readable string representation."""
         return self.name
 
 
+# Tile types a character can move onto
+WALKABLE_MASK = TileType.FLOOR | TileType.STAIRS_UP | TileType.STAIRS_DOWN
+
+# Tile types a monster can spawn on
+SPAWNABLE_MASK = int(TileType.FLOOR)
+
+
 class Direction(Enum):
     """Cardinal directions for movement and orientation."""
 
@@ -75,8 +86,12 @@ class ActionType(Enum):
         return self.name
 
 
-class TerrainType(Enum):
-    """Types of terrain that can exist on the world map."""
+class TerrainType(IntEnum):
+    """Types of terrain that can exist on the world map.
+
+    Values are small consecutive integers so per-terrain tables can be
+    plain tuples indexed by the terrain itself.
+    """
 
     PLAINS = auto()
     FOREST = auto()
@@ -90,8 +105,12 @@ class TerrainType(Enum):
         return self.name
 
 
-class LocationType(Enum):
-    """Types of locations on the world map."""
+class LocationType(IntEnum):
+    """Types of locations on the world map.
+
+    Integer-valued like TerrainType, so comparing and hashing location types
+    stays on the int fast path.
+    """
 
     SAFE_HAVEN = auto()
     DUNGEON_ENTRANCE = auto()
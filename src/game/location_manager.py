@@ -1,5 +1,6 @@
 """Manages placement and tracking of world map locations."""
 
+import math
 from typing import List, Optional, Tuple
 
 from src.models.location import DungeonEntrance, Location, SafeHaven, TowerEntrance
@@ -138,21 +139,23 @@ class LocationManager:
         Returns:
             Tuple of (nearest_location, distance) or None
         """
-        nearest = None
-        min_distance = float("inf")
+        nearest: Optional[Location] = None
+        min_distance_sq = 0
+        from_x, from_y = from_pos
 
         for location in self.locations:
             if location_type and not isinstance(location, location_type):
                 continue
 
-            dx = location.position[0] - from_pos[0]
-            dy = location.position[1] - from_pos[1]
-            distance = (dx * dx + dy * dy) ** 0.5
+            loc_x, loc_y = location.position
+            dx = loc_x - from_x
+            dy = loc_y - from_y
+            distance_sq = dx * dx + dy * dy
 
-            if distance < min_distance:
-                min_distance = distance
+            if nearest is None or distance_sq < min_distance_sq:
+                min_distance_sq = distance_sq
                 nearest = location
 
-        if nearest:
-            return (nearest, min_distance)
+        if nearest is not None:
+            return (nearest, math.sqrt(min_distance_sq))
         return None
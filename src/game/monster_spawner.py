@@ -4,10 +4,10 @@ Generated with AI assistance (Claude Opus 4) - 2025-07-23
 Part of Phase 4.1 Monster Implementation
 """
 
+import bisect
 import random
 from typing import Dict, List, Optional, Tuple, TypedDict
 
-from src.enums import TileType
 from src.models.floor import Floor
 from src.models.monster import AIBehavior, Monster
 
@@ -103,6 +103,13 @@ class MonsterSpawner:
         },
     }
 
+    # Monster types ordered by min_level, with a parallel tuple of the
+    # min levels so the eligible prefix can be found with bisect
+    _SORTED_BY_MIN_LEVEL = tuple(
+        sorted(MONSTER_TYPES.items(), key=lambda item: item[1]["min_level"])
+    )
+    _MIN_LEVELS = tuple(info["min_level"] for _, info in _SORTED_BY_MIN_LEVEL)
+
     def spawn_monsters(
         self,
         floor: Floor,
@@ -207,26 +214,8 @@ class MonsterSpawner:
         Returns:
             List of valid (x, y) positions
         """
-        valid_positions = []
         exclude_set = set(exclude_positions)
-
-        # Only spawn in rooms
-        for room in floor.rooms:
-            for x in range(room.x, room.x + room.width):
-                for y in range(room.y, room.y + room.height):
-                    pos = (x, y)
-
-                    # Check if position is valid
-                    tile = floor.tiles.get(pos)
-                    if (
-                        pos not in exclude_set
-                        and tile is not None
-                        and tile.tile_type == TileType.FLOOR
-                        and tile.tile_type not in [TileType.STAIRS_UP, TileType.STAIRS_DOWN]
-                    ):
-                        valid_positions.append(pos)
-
-        return valid_positions
+        return [pos for pos in floor.spawn_positions() if pos not in exclude_set]
 
     def _get_available_monster_types(self, level: int) -> List[str]:
         """Get monster types available at a given level.
@@ -237,10 +226,13 @@ class MonsterSpawner:
         Returns:
             List of monster type names
         """
-        available = []
-        for monster_type, info in self.MONSTER_TYPES.items():
-            if info["min_level"] <= level <= info["max_level"]:
-                available.append(monster_type)
+        # Only types with min_level <= level can qualify
+        end = bisect.bisect_right(self._MIN_LEVELS, level)
+        available = [
+            monster_type
+            for monster_type, info in self._SORTED_BY_MIN_LEVEL[:end]
+            if info["max_level"] >= level
+        ]
 
         # Always have at least basic monsters
         if not available and level >= 1:
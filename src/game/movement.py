@@ -2,7 +2,7 @@
 
 from typing import Tuple
 
-from src.enums import Direction, TileType
+from src.enums import WALKABLE_MASK, Direction
 
 
 def validate_position(pos: Tuple[int, int], floor) -> bool:
@@ -44,23 +44,19 @@ def execute_move(character, direction: Direction, floor) -> bool:
     Returns:
         True if move was successful
     """
-    # Calculate new position
-    new_pos = calculate_new_position(character.position, direction)
+    # Calculate new position from the raw coordinates (no position tuple)
+    new_x = character.x + direction.dx
+    new_y = character.y + direction.dy
 
-    # Validate position is in bounds
-    if not validate_position(new_pos, floor):
-        return False
-
-    # Check if tile is walkable
-    tile = floor.get_tile(new_pos[0], new_pos[1])
+    # Check if tile exists (None means the position is off the map)
+    tile = floor.get_tile(new_x, new_y)
     if tile is None:
         return False
 
     # Check tile type
-    walkable_tiles = {TileType.FLOOR, TileType.STAIRS_UP, TileType.STAIRS_DOWN}
-    if tile.tile_type not in walkable_tiles:
+    if not tile.tile_type & WALKABLE_MASK:
         return False
 
     # Execute the move
-    character.move_to(new_pos)
+    character.move_to_xy(new_x, new_y)
     return True
@@ -83,6 +83,13 @@ class RandomEncounters:
         },
     }
 
+    # Terrains whose weights are all zero never produce an encounter
+    _NO_ENCOUNTER_TERRAINS = frozenset(
+        terrain
+        for terrain, weights in TERRAIN_ENCOUNTER_WEIGHTS.items()
+        if sum(weights.values()) == 0
+    )
+
     # Encounter descriptions by type and terrain
     ENCOUNTER_DESCRIPTIONS = {
         (
@@ -147,8 +154,8 @@ class RandomEncounters:
         Returns:
             Encounter if one occurs, None otherwise
         """
-        # No encounters on water
-        if terrain == TerrainType.WATER:
+        # No encounters on water (or any other zero-weight terrain)
+        if terrain in self._NO_ENCOUNTER_TERRAINS:
             return None
 
         # Get encounter type based on terrain weights
@@ -160,10 +167,6 @@ class RandomEncounters:
         encounter_types = list(weights.keys())
         encounter_weights = list(weights.values())
 
-        # If all weights are 0 (shouldn't happen), return None
-        if sum(encounter_weights) == 0:
-            return None
-
         encounter_type = self.rng.choices(encounter_types, weights=encounter_weights)[0]
 
         # Calculate distance from haven for level scaling
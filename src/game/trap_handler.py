@@ -12,8 +12,11 @@ if TYPE_CHECKING:
     from src.models.character import Character
     from src.models.trap import Trap, TrapType
 
+# Trap effects that leave a lasting status on the character
+_STATUS_EFFECTS = frozenset({"poisoned"})
 
-@dataclass
+
+@dataclass(slots=True)
 class TrapResult:
     """Result of a trap trigger."""
 
@@ -52,9 +55,7 @@ class TrapHandler:
         effect = trigger_result.get("effect", "")
 
         # Determine status applied
-        status_applied = None
-        if effect == "poisoned":
-            status_applied = "poisoned"
+        status_applied = effect if effect in _STATUS_EFFECTS else None
 
         # Get alert radius for alarm traps
         alert_radius = trigger_result.get("alert_radius", 0)
@@ -68,18 +69,17 @@ class TrapHandler:
             alert_radius=alert_radius,
         )
 
-        # Log the trap trigger
-        if self.combat_log:
+        # Log the trap trigger (formatting only happens with a log attached)
+        combat_log = self.combat_log
+        if combat_log:
+            name = character.name
+            trap_name = trap.trap_type.value
             if damage > 0:
-                msg = (
-                    f"{character.name} triggered a {trap.trap_type.value} trap for {damage} damage!"
-                )
+                combat_log.add_message(f"{name} triggered a {trap_name} trap for {damage} damage!")
             else:
-                msg = f"{character.name} triggered an {trap.trap_type.value} trap!"
-
-            self.combat_log.add_message(msg)
+                combat_log.add_message(f"{name} triggered an {trap_name} trap!")
 
             if status_applied:
-                self.combat_log.add_message(f"{character.name} is {status_applied}!")
+                combat_log.add_message(f"{name} is {status_applied}!")
 
         return result
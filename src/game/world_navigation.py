@@ -1,11 +1,12 @@
 """World map navigation and movement system."""
 
-from typing import Dict, Set, Tuple
+import math
+from typing import Dict, Iterable, List, Set, Tuple
 
 from src.enums import TerrainType
 from src.models.character import Character
 from src.models.location import Location
-from src.models.world_map import WorldMap
+from src.models.world_map import WorldMap, terrain_table
 
 
 class WorldNavigation:
@@ -31,6 +32,10 @@ class WorldNavigation:
         TerrainType.WATER: 4,
     }
 
+    # Lookup tables indexed by TerrainType value (slot 0 holds the default)
+    _MOVEMENT_COST_TABLE = terrain_table(MOVEMENT_COSTS, 1.0)
+    _VISION_RADIUS_TABLE = terrain_table(VISION_RADIUS, 3)
+
     def __init__(self, world_map: WorldMap):
         """Initialize navigation system.
 
@@ -49,7 +54,7 @@ class WorldNavigation:
         Returns:
             Tiles that can be moved per turn (0 if impassable)
         """
-        return self.MOVEMENT_COSTS.get(terrain, 1.0)
+        return self._MOVEMENT_COST_TABLE[terrain or 0]
 
     def can_move_to(self, x: int, y: int) -> bool:
         """Check if position can be moved to.
@@ -58,13 +63,34 @@ class WorldNavigation:
             x: Target X coordinate
             y: Target Y coordinate
 
+        Reads WorldMap.passable_mask, so terrain set directly on tiles needs
+        WorldMap.mark_terrain_changed before it is seen here.
+
         Returns:
             True if position is valid and passable
         """
-        tile = self.world_map.get_tile(x, y)
-        if tile is None:
-            return False
-        return tile.is_passable()
+        world_map = self.world_map
+        if 0 <= x < world_map.WIDTH and 0 <= y < world_map.HEIGHT:
+            return bool(world_map.passable_mask()[y * world_map.WIDTH + x])
+        return False
+
+    def can_move_to_many(self, positions: Iterable[Tuple[int, int]]) -> List[bool]:
+        """Check several positions at once, e.g. the neighbors of a path node.
+
+        Args:
+            positions: (x, y) coordinates to check
+
+        Returns:
+            List of can_move_to results in the same order
+        """
+        world_map = self.world_map
+        width = world_map.WIDTH
+        height = world_map.HEIGHT
+        passable = world_map.passable_mask()
+        return [
+            0 <= x < width and 0 <= y < height and bool(passable[y * width + x])
+            for x, y in positions
+        ]
 
     def calculate_distance(self, from_pos: Tuple[int, int], to_pos: Tuple[int, int]) -> float:
         """Calculate straight-line distance between positions.
@@ -76,9 +102,24 @@ class WorldNavigation:
         Returns:
             Euclidean distance
         """
+        return math.hypot(to_pos[0] - from_pos[0], to_pos[1] - from_pos[1])
+
+    def calculate_distance_sq(self, from_pos: Tuple[int, int], to_pos: Tuple[int, int]) -> int:
+        """Calculate squared straight-line distance between positions.
+
+        Prefer this over calculate_distance when comparing against a radius;
+        compare with radius * radius instead of taking a square root.
+
+        Args:
+            from_pos: Starting position (x, y)
+            to_pos: Target position (x, y)
+
+        Returns:
+            Squared Euclidean distance
+        """
         dx = to_pos[0] - from_pos[0]
         dy = to_pos[1] - from_pos[1]
-        return float((dx * dx + dy * dy) ** 0.5)
+        return dx * dx + dy * dy
 
     def calculate_manhattan_distance(
         self, from_pos: Tuple[int, int], to_pos: Tuple[int, int]
@@ -103,7 +144,25 @@ class WorldNavigation:
         Returns:
             Vision radius in tiles
         """
-        return self.VISION_RADIUS.get(terrain, 3)
+        return self._VISION_RADIUS_TABLE[terrain or 0]
+
+    def movement_cost_grid(self) -> List[List[float]]:
+        """Get the movement cost of every world tile, for pathfinding.
+
+        Returns:
+            Rows of costs indexed as ``grid[y][x]``
+        """
+        table = self._MOVEMENT_COST_TABLE
+        return [[table[tile.terrain_type] for tile in row] for row in self.world_map.tiles]
+
+    def vision_radius_grid(self) -> List[List[int]]:
+        """Get the vision radius of every world tile.
+
+        Returns:
+            Rows of radii indexed as ``grid[y][x]``
+        """
+        table = self._VISION_RADIUS_TABLE
+        return [[table[tile.terrain_type] for tile in row] for row in self.world_map.tiles]
 
     def reveal_from_position(self, x: int, y: int) -> None:
         """Reveal map from a position based on terrain.
@@ -130,7 +189,7 @@ class WorldNavigation:
             Tuple of (can_enter, reason_if_not)
         """
         # First check if at the location
-        char_pos = getattr(character, "world_position", character.position)
+        char_pos = character.world_position
         if char_pos != location.position:
             return (False, "You must be at the location to enter.")
 
@@ -146,10 +205,7 @@ class WorldNavigation:
         """
         location.discover()
         self.discovered_locations.add(location.position)
-
-        # Track on character if they have that attribute
-        if hasattr(character, "discovered_locations"):
-            character.discovered_locations.add(location.position)
+        character.discovered_locations.add(location.position)
 
     def find_nearby_locations(
         self, position: Tuple[int, int], radius: int, locations: list[Location]
@@ -164,11 +220,11 @@ class WorldNavigation:
         Returns:
             List of locations within radius
         """
-        nearby = []
-        for location in locations:
-            if self.calculate_distance(position, location.position) <= radius:
-                nearby.append(location)
-        return nearby
+        r2 = radius * radius
+        distance_sq = self.calculate_distance_sq
+        return [
+            location for location in locations if distance_sq(position, location.position) <= r2
+        ]
 
     def check_location_discovery(
         self, character_pos: Tuple[int, int], locations: list[Location], discovery_radius: int = 3
@@ -183,11 +239,12 @@ class WorldNavigation:
         Returns:
             List of newly discovered locations
         """
+        r2 = discovery_radius * discovery_radius
         newly_discovered = []
         for location in locations:
-            if not location.discovered:
-                distance = self.calculate_distance(character_pos, location.position)
-                if distance <= discovery_radius:
-                    location.discover()
-                    newly_discovered.append(location)
+            if location.discovered:
+                continue
+            if self.calculate_distance_sq(character_pos, location.position) <= r2:
+                location.discover()
+                newly_discovered.append(location)
         return newly_discovered
@@ -1,6 +1,7 @@
 """Keyboard input handler for character movement."""
 
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Deque, Dict, Optional
 
 from src.enums import Direction
 
@@ -10,17 +11,13 @@ class KeyboardHandler:
 
     def __init__(self):
         """Initialize keyboard handler with key mappings."""
-        self.command_queue: List[Direction] = []
+        self.command_queue: Deque[Direction] = deque()
         self.key_map: Dict[str, Direction] = {
-            # WASD keys
+            # WASD keys (lowercase; keys are normalized before lookup)
             "w": Direction.NORTH,
-            "W": Direction.NORTH,
             "a": Direction.WEST,
-            "A": Direction.WEST,
             "s": Direction.SOUTH,
-            "S": Direction.SOUTH,
             "d": Direction.EAST,
-            "D": Direction.EAST,
             # Arrow keys could be added here with proper key codes
             # For now, focusing on WASD as specified in UTF contract
         }
@@ -28,13 +25,15 @@ class KeyboardHandler:
     def map_key_to_direction(self, key: str) -> Optional[Direction]:
         """Map a key press to a direction.
 
+        Key lookup is case-insensitive.
+
         Args:
             key: Key character pressed
 
         Returns:
             Direction enum if valid key, None otherwise
         """
-        return self.key_map.get(key)
+        return self.key_map.get(key.lower())
 
     def queue_command(self, key: str) -> None:
         """Queue a command based on key press.
@@ -53,7 +52,7 @@ class KeyboardHandler:
             Next Direction command or None if queue is empty
         """
         if self.command_queue:
-            return self.command_queue.pop(0)
+            return self.command_queue.popleft()
         return None
 
     def clear_queue(self) -> None:
@@ -4,15 +4,43 @@ Generated with AI assistance (Claude Opus 4) - 2025-07-23
 Modified for Phase 4.1 Monster Implementation
 """
 
-from typing import Dict, Tuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Set, Tuple
 
-from src.enums import ActionType, Direction, EntityType, TileType
+from src.enums import WALKABLE_MASK, ActionType, Direction, EntityType
 from src.models.floor import Floor
 
+# Shared read-only view returned while a character has no status effects
+_NO_STATUS_EFFECTS: Mapping[str, int] = MappingProxyType({})
+
 
 class Character:
     """Represents a player character with movement and stamina."""
 
+    # Core stats live in slots; __dict__ is kept so UI code can still attach
+    # extra display attributes (created lazily only when one is set)
+    __slots__ = (
+        "name",
+        "x",
+        "y",
+        "entity_type",
+        "_stamina",
+        "stamina_max",
+        "hp",
+        "hp_max",
+        "_status_effects",
+        "attack",
+        "defense",
+        "crit_chance",
+        "level",
+        "experience",
+        "luck",
+        "dungeons_completed",
+        "_world_position",
+        "discovered_locations",
+        "__dict__",
+    )
+
     def __init__(self, name: str, x: int, y: int):
         """Initialize a character.
 
@@ -29,7 +57,8 @@ class Character:
         self.stamina_max = 100
         self.hp = 100
         self.hp_max = 100
-        self.status_effects: Dict[str, int] = {}
+        # Allocated on the first apply_status; most characters never get one
+        self._status_effects: Optional[Dict[str, int]] = None
         # Combat stats
         self.attack = 10
         self.defense = 5
@@ -38,22 +67,59 @@ class Character:
         self.level = 1
         self.experience = 0
         self.luck = 0
+        self.dungeons_completed = 0
+        # Overworld position when it differs from the current map position
+        self._world_position: Optional[Tuple[int, int]] = None
+        self.discovered_locations: Set[Tuple[int, int]] = set()
 
     @property
     def stamina(self) -> int:
-        """Get current stamina."""
-        return max(0, min(self._stamina, self.stamina_max))
+        """Get current stamina.
+
+        Still clamped on read because stamina_max can be lowered after the
+        value was stored.
+        """
+        stamina = self._stamina
+        stamina_max = self.stamina_max
+        if stamina > stamina_max:
+            stamina = stamina_max
+        return stamina if stamina > 0 else 0
 
     @stamina.setter
     def stamina(self, value: int) -> None:
         """Set stamina, clamped between 0 and stamina_max."""
-        self._stamina = max(0, min(value, self.stamina_max))
+        stamina_max = self.stamina_max
+        if value > stamina_max:
+            value = stamina_max
+        self._stamina = value if value > 0 else 0
+
+    @property
+    def status_effects(self) -> Mapping[str, int]:
+        """Get a read-only view of active status effects and their remaining turns.
+
+        Use apply_status, decrement_status and remove_status to change effects.
+        """
+        if self._status_effects is None:
+            return _NO_STATUS_EFFECTS
+        return MappingProxyType(self._status_effects)
 
     @property
     def position(self) -> Tuple[int, int]:
         """Get current position as tuple."""
         return (self.x, self.y)
 
+    @property
+    def world_position(self) -> Tuple[int, int]:
+        """Get overworld position, falling back to the current position."""
+        if self._world_position is None:
+            return (self.x, self.y)
+        return self._world_position
+
+    @world_position.setter
+    def world_position(self, value: Optional[Tuple[int, int]]) -> None:
+        """Set overworld position; None follows the current position again."""
+        self._world_position = value
+
     def move_to(self, new_pos: Tuple[int, int]) -> None:
         """Move character to a new position.
 
@@ -62,6 +128,16 @@ class Character:
         """
         self.x, self.y = new_pos
 
+    def move_to_xy(self, x: int, y: int) -> None:
+        """Move character to a new position given as separate coordinates.
+
+        Args:
+            x: New X coordinate
+            y: New Y coordinate
+        """
+        self.x = x
+        self.y = y
+
     def validate_move(self, direction: Direction, floor: Floor) -> bool:
         """Check if a move in the given direction is valid.
 
@@ -76,18 +152,12 @@ class Character:
         new_x = self.x + direction.dx
         new_y = self.y + direction.dy
 
-        # Check bounds
-        if not floor.is_valid_position(new_x, new_y):
-            return False
-
-        # Check tile is walkable
+        # Floors only hold tiles for on-map positions, so get_tile returning
+        # None doubles as the bounds check
         tile = floor.get_tile(new_x, new_y)
-        if tile is None:
-            return False
 
         # Can walk on floor, stairs, but not walls
-        walkable_tiles = {TileType.FLOOR, TileType.STAIRS_UP, TileType.STAIRS_DOWN}
-        return tile.tile_type in walkable_tiles
+        return tile is not None and bool(tile.tile_type & WALKABLE_MASK)
 
     def perform_action(self, action_type: ActionType, cost: int) -> bool:
         """Perform an action if sufficient stamina is available.
@@ -127,7 +197,44 @@ class Character:
             status: Name of the status effect
             duration: Duration in turns
         """
-        self.status_effects[status] = duration
+        if self._status_effects is None:
+            self._status_effects = {}
+        self._status_effects[status] = duration
+
+    def decrement_status(self, status: str, turns: int = 1) -> int:
+        """Reduce the remaining duration of a status effect.
+
+        The effect is removed once its duration reaches zero.
+
+        Args:
+            status: Name of the status effect
+            turns: Number of turns to subtract
+
+        Returns:
+            Remaining duration, or 0 if the effect is not active
+        """
+        if not self._status_effects or status not in self._status_effects:
+            return 0
+        remaining = self._status_effects[status] - turns
+        if remaining > 0:
+            self._status_effects[status] = remaining
+            return remaining
+        del self._status_effects[status]
+        return 0
+
+    def remove_status(self, status: str) -> bool:
+        """Remove a status effect from the character.
+
+        Args:
+            status: Name of the status effect
+
+        Returns:
+            True if the effect was active and has been removed
+        """
+        if not self._status_effects or status not in self._status_effects:
+            return False
+        del self._status_effects[status]
+        return True
 
     def is_alive(self) -> bool:
         """Check if character is still alive.
@@ -4,14 +4,21 @@ Generated with AI assistance (Claude Opus 4) - 2025-07-23
 Part of Phase 4.1 Monster Implementation
 """
 
-from abc import ABC, abstractmethod
 from typing import Tuple
 
 from src.enums import EntityType
 
 
-class Entity(ABC):
-    """Simple abstract base class for all game entities."""
+class Entity:
+    """Simple base class for all game entities.
+
+    A plain class rather than an ABC, so construction and isinstance checks
+    skip the ABCMeta machinery; subclasses must override render and update.
+    Monsters are spawned a floor at a time, so subclasses list their own
+    attributes in ``__slots__`` as well.
+    """
+
+    __slots__ = ("x", "y", "entity_type")
 
     def __init__(self, x: int, y: int, entity_type: EntityType):
         """Initialize entity with position and type."""
@@ -24,12 +31,10 @@ class Entity(ABC):
         """Get position as tuple."""
         return (self.x, self.y)
 
-    @abstractmethod
     def render(self) -> str:
         """Return display character for entity."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def update(self, delta_time: float) -> None:
         """Update entity state."""
-        pass
+        raise NotImplementedError
@@ -1,15 +1,69 @@
 """Floor generation system for dungeon levels."""
 
 import random
-from collections import deque
-from typing import Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from src.enums import TileType
+from src.enums import SPAWNABLE_MASK, WALKABLE_MASK, TileType
 from src.models.tile import Tile
 
+if TYPE_CHECKING:
+    from src.models.entity import Entity
+
+# Maps a TileType value (or 0 for a missing tile) to 1 if walkable, for bytes.translate
+_WALKABLE_BYTES = bytes(1 if code & WALKABLE_MASK else 0 for code in range(256))
+
+
+def _flood_fill(walkable: bytearray, width: int, start: int, reached: bytearray) -> None:
+    """Mark every cell reachable from start through 4-connected walkable cells.
+
+    Cells are flat row-major indices into ``walkable`` and ``reached``. Cells
+    are marked when queued, so each one is visited once, and the queue is a
+    plain list read through a head index.
+
+    Args:
+        walkable: 1 for walkable cells, 0 otherwise
+        width: Row length of the grid
+        start: Index of the starting cell (always marked)
+        reached: Output flags, set to 1 for every reached cell
+    """
+    size = len(walkable)
+    reached[start] = 1
+    queue = [start]
+    head = 0
+
+    while head < len(queue):
+        index = queue[head]
+        head += 1
+        x = index % width
+
+        if x + 1 < width:
+            neighbor = index + 1
+            if walkable[neighbor] and not reached[neighbor]:
+                reached[neighbor] = 1
+                queue.append(neighbor)
+        if x > 0:
+            neighbor = index - 1
+            if walkable[neighbor] and not reached[neighbor]:
+                reached[neighbor] = 1
+                queue.append(neighbor)
+        neighbor = index + width
+        if neighbor < size and walkable[neighbor] and not reached[neighbor]:
+            reached[neighbor] = 1
+            queue.append(neighbor)
+        neighbor = index - width
+        if neighbor >= 0 and walkable[neighbor] and not reached[neighbor]:
+            reached[neighbor] = 1
+            queue.append(neighbor)
+
 
 class Room:
-    """Represents a rectangular room in the floor."""
+    """Represents a rectangular room in the floor.
+
+    Rooms are not moved or resized after creation, so the right and bottom
+    edges are stored alongside the origin.
+    """
+
+    __slots__ = ("x", "y", "width", "height", "x2", "y2", "center_x", "center_y")
 
     def __init__(self, x: int, y: int, width: int, height: int):
         """Initialize a room with position and dimensions.
@@ -24,16 +78,12 @@ class Room:
         self.y = y
         self.width = width
         self.height = height
-
-    @property
-    def x2(self) -> int:
-        """Get the right edge coordinate."""
-        return self.x + self.width - 1
-
-    @property
-    def y2(self) -> int:
-        """Get the bottom edge coordinate."""
-        return self.y + self.height - 1
+        # Right and bottom edge coordinates (inclusive)
+        self.x2 = x + width - 1
+        self.y2 = y + height - 1
+        # Center point, used for corridors, stairs and connectivity checks
+        self.center_x = x + width // 2
+        self.center_y = y + height // 2
 
     def overlaps(self, other: "Room", min_distance: int = 1) -> bool:
         """Check if this room overlaps with another room.
@@ -45,29 +95,19 @@ class Room:
         Returns:
             True if rooms are too close, False otherwise
         """
-        # Expand the room boundaries by min_distance on all sides
-        # to ensure rooms have space between them
-        self_x1 = self.x - min_distance
-        self_y1 = self.y - min_distance
-        self_x2 = self.x2 + min_distance
-        self_y2 = self.y2 + min_distance
-
-        other_x1 = other.x - min_distance
-        other_y1 = other.y - min_distance
-        other_x2 = other.x2 + min_distance
-        other_y2 = other.y2 + min_distance
-
-        # Check if one room is to the left of the other
-        if self_x2 < other_x1 or other_x2 < self_x1:
-            return False
-        # Check if one room is above the other
-        if self_y2 < other_y1 or other_y2 < self_y1:
-            return False
-        return True
+        # Each room is expanded by min_distance on all sides, so the gap
+        # between them must exceed twice that to count as separate
+        gap = 2 * min_distance
+        return not (
+            self.x2 + gap < other.x
+            or other.x2 + gap < self.x
+            or self.y2 + gap < other.y
+            or other.y2 + gap < self.y
+        )
 
     def center(self) -> Tuple[int, int]:
         """Get the center point of the room."""
-        return (self.x + self.width // 2, self.y + self.height // 2)
+        return (self.center_x, self.center_y)
 
     def contains_point(self, x: int, y: int) -> bool:
         """Check if a point is inside this room."""
@@ -114,27 +154,87 @@ class Floor:
         self.level = level
         self.width = width or self.FLOOR_WIDTH
         self.height = height or self.FLOOR_HEIGHT
+        # Code outside Floor that adds, removes or retypes tiles should call
+        # mark_tiles_changed afterwards so the cached planes are rebuilt
         self.tiles: Dict[Tuple[int, int], Tile] = {}
         self.rooms: List[Room] = []
+        self.traps: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self.chests: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        # Entities on the floor keyed by the (x, y) cell they stand on; code
+        # that moves an entity re-keys it here
+        self.entities: Dict[Tuple[int, int], "Entity"] = {}
         self._random = random.Random(seed)
+        # Bumped whenever tiles change so derived caches know to rebuild
+        self._tiles_version = 0
+        self._spawn_positions_cache: Optional[
+            Tuple[int, Tuple[Room, ...], List[Tuple[int, int]]]
+        ] = None
+        self._type_plane_cache: Optional[Tuple[int, bytearray]] = None
+        self._walkable_cache: Optional[Tuple[int, bytearray]] = None
+        # Where place_stairs put the stairs, checked before scanning for them
+        self._stairs_up: Optional[Tuple[int, int]] = None
+        self._stairs_down: Optional[Tuple[int, int]] = None
+        # Flood fill output, reused and cleared in place by each connectivity check
+        self._visited_buf = bytearray(self.width * self.height)
+
+    def copy(self) -> "Floor":
+        """Create an independent copy of this floor's layout.
+
+        Tiles are rebuilt with the same types, so occupants and items are not
+        carried over. Rooms are shared since they never change after creation.
+
+        Returns:
+            New floor with the same tiles, rooms, traps, chests and random state
+        """
+        floor = type(self)(self.seed, self.width, self.height, self.level)
+        floor.tiles = {(x, y): Tile(x, y, tile.tile_type) for (x, y), tile in self.tiles.items()}
+        floor.rooms = list(self.rooms)
+        floor.traps = {position: dict(trap) for position, trap in self.traps.items()}
+        floor.chests = {position: dict(chest) for position, chest in self.chests.items()}
+        floor._random.setstate(self._random.getstate())
+        floor._stairs_up = self._stairs_up
+        floor._stairs_down = self._stairs_down
+        return floor
+
+    def mark_tiles_changed(self) -> None:
+        """Invalidate caches derived from the tile layout.
+
+        Floor methods call this themselves. Code that writes to ``tiles``
+        directly, or retypes a Tile in it, must call it too before the floor
+        is queried or rendered again.
+        """
+        self._tiles_version += 1
 
     def generate(self) -> None:
         """Generate the floor layout with rooms."""
-        # Initialize all tiles as walls
-        for y in range(self.height):
-            for x in range(self.width):
-                self.tiles[(x, y)] = Tile(x, y, TileType.WALL)
+        self.mark_tiles_changed()
 
         # Generate rooms
         self._generate_rooms()
 
-        # Carve out rooms from the walls
-        self._carve_rooms()
+        # Lay out tile types on a flat row-major plane (all walls), carve the
+        # rooms into it, then build each Tile once with its final type
+        plane = bytearray([TileType.WALL]) * (self.width * self.height)
+        self._carve_rooms(plane)
+
+        wall = TileType.WALL
+        floor = TileType.FLOOR
+        tiles = self.tiles
+        for y in range(self.height):
+            row = y * self.width
+            for x in range(self.width):
+                tiles[(x, y)] = Tile(x, y, floor if plane[row + x] == floor else wall)
 
     def _generate_rooms(self) -> None:
         """Generate random non-overlapping rooms."""
         room_count = self._random.randint(self.MIN_ROOMS, self.MAX_ROOMS)
 
+        # Bounds of placed rooms as (x, y, x2 + gap, y2 + gap) rows, so the
+        # overlap test (same rule as Room.overlaps with min_distance=1) runs
+        # on plain ints and a Room is only built once a spot is accepted
+        gap = 2
+        placed = [(room.x, room.y, room.x2 + gap, room.y2 + gap) for room in self.rooms]
+
         attempts = 0
         max_attempts = 100
 
@@ -154,20 +254,31 @@ class Floor:
 
             x = self._random.randint(self.EDGE_BUFFER, max_x)
             y = self._random.randint(self.EDGE_BUFFER, max_y)
-
-            new_room = Room(x, y, width, height)
+            far_x = x + width - 1 + gap
+            far_y = y + height - 1 + gap
 
             # Check if room overlaps with any existing room
-            if not any(new_room.overlaps(room) for room in self.rooms):
-                self.rooms.append(new_room)
+            if not any(
+                px <= far_x and x <= px2 and py <= far_y and y <= py2 for px, py, px2, py2 in placed
+            ):
+                self.rooms.append(Room(x, y, width, height))
+                placed.append((x, y, far_x, far_y))
+
+    def _carve_rooms(self, plane: bytearray) -> None:
+        """Carve out rooms by setting their cells to FLOOR type.
 
-    def _carve_rooms(self) -> None:
-        """Carve out rooms by setting their tiles to FLOOR type."""
+        Args:
+            plane: Row-major tile type codes, one byte per cell
+        """
         for room in self.rooms:
-            for y in range(room.y, room.y + room.height):
-                for x in range(room.x, room.x + room.width):
-                    if (x, y) in self.tiles:
-                        self.tiles[(x, y)] = Tile(x, y, TileType.FLOOR)
+            x_start = max(room.x, 0)
+            x_end = min(room.x + room.width, self.width)
+            if x_start >= x_end:
+                continue
+            floor_row = bytes([TileType.FLOOR]) * (x_end - x_start)
+            for y in range(max(room.y, 0), min(room.y + room.height, self.height)):
+                row = y * self.width
+                plane[row + x_start : row + x_end] = floor_row
 
     def get_tile(self, x: int, y: int) -> Optional[Tile]:
         """Get the tile at the specified coordinates.
@@ -198,59 +309,103 @@ class Floor:
         if len(self.rooms) < 2:
             return
 
+        self.mark_tiles_changed()
+
         # Connect each room to the next one
         for i in range(len(self.rooms) - 1):
             room1 = self.rooms[i]
             room2 = self.rooms[i + 1]
 
             # Get center points of rooms
-            x1 = room1.x + room1.width // 2
-            y1 = room1.y + room1.height // 2
-            x2 = room2.x + room2.width // 2
-            y2 = room2.y + room2.height // 2
-
-            # Create L-shaped corridor (horizontal then vertical)
-            # Randomly choose whether to go horizontal first or vertical first
-            if self._random.random() < 0.5:
-                # Horizontal first
-                self._create_horizontal_corridor(x1, x2, y1)
-                self._create_vertical_corridor(y1, y2, x2)
-            else:
-                # Vertical first
-                self._create_vertical_corridor(y1, y2, x1)
-                self._create_horizontal_corridor(x1, x2, y2)
-
-    def _create_horizontal_corridor(self, x1: int, x2: int, y: int) -> None:
-        """Create a horizontal corridor."""
-        start = min(x1, x2)
-        end = max(x1, x2) + 1
-        for x in range(start, end):
-            if self.is_valid_position(x, y):
-                self.tiles[(x, y)] = Tile(x, y, TileType.FLOOR)
-
-    def _create_vertical_corridor(self, y1: int, y2: int, x: int) -> None:
-        """Create a vertical corridor."""
-        start = min(y1, y2)
-        end = max(y1, y2) + 1
-        for y in range(start, end):
-            if self.is_valid_position(x, y):
-                self.tiles[(x, y)] = Tile(x, y, TileType.FLOOR)
+            x1 = room1.center_x
+            y1 = room1.center_y
+            x2 = room2.center_x
+            y2 = room2.center_y
+
+            # Create L-shaped corridor, randomly choosing whether to go
+            # horizontal first or vertical first
+            self._carve_corridor(x1, y1, x2, y2, self._random.random() < 0.5)
+
+    def _carve_corridor(self, x1: int, y1: int, x2: int, y2: int, horizontal_first: bool) -> None:
+        """Carve an L-shaped corridor between two points.
+
+        Each leg is clipped to the floor bounds once rather than checking
+        every cell.
+
+        Args:
+            x1: Starting X coordinate
+            y1: Starting Y coordinate
+            x2: Ending X coordinate
+            y2: Ending Y coordinate
+            horizontal_first: Run along y1 then down x2 if True, else along x1 then y2
+        """
+        if horizontal_first:
+            row, column = y1, x2
+        else:
+            row, column = y2, x1
+
+        if 0 <= row < self.FLOOR_HEIGHT:
+            for x in range(max(min(x1, x2), 0), min(max(x1, x2) + 1, self.FLOOR_WIDTH)):
+                self._make_floor(x, row)
+        if 0 <= column < self.FLOOR_WIDTH:
+            for y in range(max(min(y1, y2), 0), min(max(y1, y2) + 1, self.FLOOR_HEIGHT)):
+                self._make_floor(column, y)
+
+    def _make_floor(self, x: int, y: int) -> None:
+        """Turn the tile at a position into FLOOR, reusing the existing Tile.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+        """
+        tile = self.tiles.get((x, y))
+        if tile is None:
+            self.tiles[(x, y)] = Tile(x, y, TileType.FLOOR)
+        elif tile.tile_type != TileType.FLOOR:
+            tile.tile_type = TileType.FLOOR
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, tile_type: TileType) -> None:
+        """Set every tile in a rectangle to one type, e.g. to clear an area.
+
+        The rectangle is clipped to the floor, existing Tiles are retyped in
+        place, and derived caches are invalidated once for the whole area.
+
+        Args:
+            x: Left coordinate of the rectangle
+            y: Top coordinate of the rectangle
+            width: Width of the rectangle in tiles
+            height: Height of the rectangle in tiles
+            tile_type: Type to give every tile in the rectangle
+        """
+        tiles = self.tiles
+        x_range = range(max(x, 0), min(x + width, self.width))
+        for row in range(max(y, 0), min(y + height, self.height)):
+            for column in x_range:
+                tile = tiles.get((column, row))
+                if tile is None:
+                    tiles[(column, row)] = Tile(column, row, tile_type)
+                elif tile.tile_type != tile_type:
+                    tile.tile_type = tile_type
+        self.mark_tiles_changed()
 
     def place_stairs(self) -> None:
         """Place stairs up and down in different rooms."""
         if len(self.rooms) < 2:
             return
 
+        self.mark_tiles_changed()
+
         # Select two different rooms
         selected_rooms = self._random.sample(self.rooms, 2)
 
         # Place stairs up in first room
         room_up = selected_rooms[0]
-        center_x = room_up.x + room_up.width // 2
-        center_y = room_up.y + room_up.height // 2
+        center_x = room_up.center_x
+        center_y = room_up.center_y
 
         if self.tiles[(center_x, center_y)].tile_type == TileType.FLOOR:
-            self.tiles[(center_x, center_y)] = Tile(center_x, center_y, TileType.STAIRS_UP)
+            self.tiles[(center_x, center_y)].tile_type = TileType.STAIRS_UP
+            self._stairs_up = (center_x, center_y)
         else:
             # Find any floor tile in the room
             floor_tiles = []
@@ -260,15 +415,17 @@ class Floor:
                         floor_tiles.append((x, y))
             if floor_tiles:
                 x, y = self._random.choice(floor_tiles)
-                self.tiles[(x, y)] = Tile(x, y, TileType.STAIRS_UP)
+                self.tiles[(x, y)].tile_type = TileType.STAIRS_UP
+                self._stairs_up = (x, y)
 
         # Place stairs down in second room
         room_down = selected_rooms[1]
-        center_x = room_down.x + room_down.width // 2
-        center_y = room_down.y + room_down.height // 2
+        center_x = room_down.center_x
+        center_y = room_down.center_y
 
         if self.tiles[(center_x, center_y)].tile_type == TileType.FLOOR:
-            self.tiles[(center_x, center_y)] = Tile(center_x, center_y, TileType.STAIRS_DOWN)
+            self.tiles[(center_x, center_y)].tile_type = TileType.STAIRS_DOWN
+            self._stairs_down = (center_x, center_y)
         else:
             # Find any floor tile in the room
             floor_tiles = []
@@ -278,7 +435,49 @@ class Floor:
                         floor_tiles.append((x, y))
             if floor_tiles:
                 x, y = self._random.choice(floor_tiles)
-                self.tiles[(x, y)] = Tile(x, y, TileType.STAIRS_DOWN)
+                self.tiles[(x, y)].tile_type = TileType.STAIRS_DOWN
+                self._stairs_down = (x, y)
+
+    def find_stairs_up(self) -> Optional[Tuple[int, int]]:
+        """Find the stairs up on this floor.
+
+        Returns:
+            Position (x, y) of the stairs up, or None if there are none
+        """
+        return self._find_tile_type(TileType.STAIRS_UP, self._stairs_up)
+
+    def find_stairs_down(self) -> Optional[Tuple[int, int]]:
+        """Find the stairs down on this floor.
+
+        Returns:
+            Position (x, y) of the stairs down, or None if there are none
+        """
+        return self._find_tile_type(TileType.STAIRS_DOWN, self._stairs_down)
+
+    def _find_tile_type(
+        self, tile_type: TileType, hint: Optional[Tuple[int, int]] = None
+    ) -> Optional[Tuple[int, int]]:
+        """Find a tile of a type, trying a remembered position first.
+
+        Falls back to the first in-bounds match in row-major order when the
+        hint is missing or the tile there has since been retyped.
+
+        Args:
+            tile_type: Type of tile to look for
+            hint: Position where the tile was last placed, if known
+
+        Returns:
+            Position (x, y) of the tile, or None if there is none
+        """
+        if hint is not None:
+            tile = self.tiles.get(hint)
+            if tile is not None and tile.tile_type == tile_type:
+                return hint
+
+        index = self.tile_type_plane().find(tile_type)
+        if index == -1:
+            return None
+        return (index % self.width, index // self.width)
 
     def is_fully_connected(self) -> bool:
         """Check if all rooms are connected to each other.
@@ -289,89 +488,148 @@ class Floor:
         if len(self.rooms) < 2:
             return True
 
-        # Start from the first room
+        # Start from the first room; bail out before building any buffers
+        # if its center is off the floor or not walkable (e.g. carving failed)
         start_room = self.rooms[0]
-        start_x = start_room.x + start_room.width // 2
-        start_y = start_room.y + start_room.height // 2
+        start_x = start_room.center_x
+        start_y = start_room.center_y
+        if not (0 <= start_x < self.width and 0 <= start_y < self.height):
+            return False
+        start_tile = self.tiles.get((start_x, start_y))
+        if start_tile is None or not start_tile.tile_type & WALKABLE_MASK:
+            return False
 
-        # Use BFS to find all reachable floor tiles
-        visited: Set[Tuple[int, int]] = set()
-        queue = deque([(start_x, start_y)])
+        # Read walkability from the tiles as they are now rather than the
+        # cached mask, so tiles changed directly are never missed
+        width = self.width
+        height = self.height
+        walkable = self.build_tile_type_plane().translate(_WALKABLE_BYTES)
 
-        while queue:
-            x, y = queue.popleft()
-            if (x, y) in visited:
-                continue
-            visited.add((x, y))
-
-            # Check all adjacent positions
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                next_x, next_y = x + dx, y + dy
-                if (next_x, next_y) not in visited and self.is_valid_position(next_x, next_y):
-                    tile = self.tiles.get((next_x, next_y))
-                    if tile and tile.tile_type in [
-                        TileType.FLOOR,
-                        TileType.STAIRS_UP,
-                        TileType.STAIRS_DOWN,
-                    ]:
-                        queue.append((next_x, next_y))
-
-        # Check if we can reach all rooms
-        for room in self.rooms:
-            # Check if at least one tile in the room was visited
-            room_visited = False
-            for y in range(room.y, room.y + room.height):
-                for x in range(room.x, room.x + room.width):
-                    if (x, y) in visited:
-                        room_visited = True
-                        break
-                if room_visited:
-                    break
+        # Flood fill over flat row-major indices to mark every reachable cell
+        reached = self._visited_buf
+        reached[:] = bytes(len(reached))
+        _flood_fill(walkable, width, start_y * width + start_x, reached)
 
-            if not room_visited:
+        # Every room needs at least one reached cell; scan each room row in C
+        for room in self.rooms:
+            x_start = max(room.x, 0)
+            x_end = min(room.x + room.width, width)
+            rows = range(max(room.y, 0), min(room.y + room.height, height))
+            if not any(reached.find(1, y * width + x_start, y * width + x_end) != -1 for y in rows):
                 return False
 
         return True
 
+    def spawn_positions(self) -> List[Tuple[int, int]]:
+        """Get every position inside a room where a monster may spawn.
+
+        The list is cached until the tiles change (see mark_tiles_changed) or
+        the rooms are added, removed or replaced, so callers must not modify it.
+
+        Returns:
+            (x, y) positions of spawnable tiles in rooms, room by room
+        """
+        rooms = tuple(self.rooms)
+        cache = self._spawn_positions_cache
+        if cache is None or cache[0] != self._tiles_version or cache[1] != rooms:
+            positions = []
+            get_tile = self.tiles.get
+            for room in rooms:
+                for x in range(room.x, room.x + room.width):
+                    for y in range(room.y, room.y + room.height):
+                        tile = get_tile((x, y))
+                        if tile is not None and tile.tile_type & SPAWNABLE_MASK:
+                            positions.append((x, y))
+            cache = (self._tiles_version, rooms, positions)
+            self._spawn_positions_cache = cache
+        return cache[2]
+
+    def build_tile_type_plane(self) -> bytearray:
+        """Read the type of every in-bounds tile into a new flat row-major array.
+
+        Unlike tile_type_plane this is never cached, so it always reflects the
+        tiles as they are now, including writes made without calling
+        mark_tiles_changed.
+
+        Returns:
+            Bytearray where index ``y * self.width + x`` holds the TileType
+            value, or 0 where there is no tile
+        """
+        get_tile = self.tiles.get
+        return bytearray(
+            0 if (tile := get_tile((x, y))) is None else tile.tile_type
+            for y in range(self.height)
+            for x in range(self.width)
+        )
+
+    def tile_type_plane(self) -> bytearray:
+        """Get the type of every in-bounds tile as a flat row-major array.
+
+        The array is cached until the tiles change (see mark_tiles_changed),
+        so callers must not modify it. Use build_tile_type_plane where the
+        tiles may have been written directly.
+
+        Returns:
+            Bytearray laid out as in build_tile_type_plane
+        """
+        cache = self._type_plane_cache
+        if cache is None or cache[0] != self._tiles_version:
+            cache = (self._tiles_version, self.build_tile_type_plane())
+            self._type_plane_cache = cache
+        return cache[1]
+
+    def walkable_mask(self) -> bytearray:
+        """Get walkability of every in-bounds cell as a flat row-major array.
+
+        Cached like tile_type_plane, so callers must not modify it. Area checks
+        can scan a row slice in C, e.g. a run of cells is all walkable when
+        ``mask.find(0, start, end) == -1``.
+
+        Returns:
+            Bytearray where index ``y * self.width + x`` is 1 if the tile is walkable
+        """
+        cache = self._walkable_cache
+        if cache is None or cache[0] != self._tiles_version:
+            cache = (self._tiles_version, self.tile_type_plane().translate(_WALKABLE_BYTES))
+            self._walkable_cache = cache
+        return cache[1]
+
     def place_traps(self, density: float = 0.1) -> None:
         """Place traps on the floor based on density.
 
         Args:
             density: Percentage of floor tiles that should have traps (0.0-1.0)
         """
-        if not hasattr(self, "traps"):
-            self.traps = {}
-
         # Clamp density to valid range
         density = max(0.0, min(1.0, density))
 
-        # Get all valid floor tiles
-        valid_positions = []
-        for (x, y), tile in self.tiles.items():
-            # Skip walls, stairs, and spawn points
-            if tile.tile_type == TileType.FLOOR:
-                # Skip room center points (potential spawn locations)
-                is_room_center = False
-                for room in self.rooms:
-                    center_x = room.x + room.width // 2
-                    center_y = room.y + room.height // 2
-                    if (x, y) == (center_x, center_y):
-                        is_room_center = True
-                        break
-
-                if not is_room_center:
-                    valid_positions.append((x, y))
+        # Room center points are potential spawn locations
+        width = self.width
+        room_centers = frozenset(
+            room.center_y * width + room.center_x
+            for room in self.rooms
+            if 0 <= room.center_x < width and 0 <= room.center_y < self.height
+        )
+
+        # Get flat indices of all valid floor tiles, skipping walls, stairs,
+        # and spawn points. Reads the same cached tile plane as place_chests,
+        # so the grid is walked once per layout rather than once per pass;
+        # only the sampled indices are turned into (x, y) positions
+        floor = TileType.FLOOR
+        valid_indices = [
+            index
+            for index, code in enumerate(self.tile_type_plane())
+            if code == floor and index not in room_centers
+        ]
 
         # Calculate number of traps to place
-        num_traps = int(len(valid_positions) * density)
+        num_traps = int(len(valid_indices) * density)
 
         # Randomly select positions for traps
-        if num_traps > 0 and valid_positions:
-            trap_positions = self._random.sample(
-                valid_positions, min(num_traps, len(valid_positions))
-            )
-            for pos in trap_positions:
-                self.traps[pos] = {
+        if num_traps > 0 and valid_indices:
+            trap_indices = self._random.sample(valid_indices, min(num_traps, len(valid_indices)))
+            for index in trap_indices:
+                self.traps[(index % width, index // width)] = {
                     "revealed": False,
                     "damage": self._random.randint(1, 3),  # 1-3 damage
                 }
@@ -382,32 +640,43 @@ class Floor:
         Args:
             count: Number of chests to place
         """
-        if not hasattr(self, "chests"):
-            self.chests = {}
-
-        # Find valid positions in rooms (not doorways or stairs)
-        valid_positions = []
+        # Find valid positions in rooms (not doorways or stairs), reading tile
+        # types from the flat plane by index instead of looking up (x, y) keys
+        width = self.width
+        plane = self.tile_type_plane()
+        floor = TileType.FLOOR
+        wall = TileType.WALL
+        valid_indices = []
         for room in self.rooms:
-            for y in range(room.y + 1, room.y + room.height - 1):
-                for x in range(room.x + 1, room.x + room.width - 1):
-                    tile = self.tiles.get((x, y))
-                    if tile and tile.tile_type == TileType.FLOOR:
+            # Room interiors never touch the outer ring of the grid, so every
+            # neighbor index below stays in bounds
+            x_start = max(room.x + 1, 1)
+            x_end = min(room.x2, width - 1)
+            for y in range(max(room.y + 1, 1), min(room.y2, self.height - 1)):
+                row = y * width
+                for x in range(x_start, x_end):
+                    index = row + x
+                    if plane[index] == floor:
                         # Check if it's not a doorway (has walls on opposite sides)
-                        adjacent_walls = 0
-                        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                            adj_tile = self.tiles.get((x + dx, y + dy))
-                            if adj_tile and adj_tile.tile_type == TileType.WALL:
-                                adjacent_walls += 1
+                        adjacent_walls = (
+                            (plane[index + width] == wall)
+                            + (plane[index + 1] == wall)
+                            + (plane[index - width] == wall)
+                            + (plane[index - 1] == wall)
+                        )
 
                         # Not a doorway if it doesn't have walls on exactly opposite sides
                         if adjacent_walls < 2:
-                            valid_positions.append((x, y))
+                            valid_indices.append(index)
 
         # Place chests
-        if valid_positions:
-            chest_positions = self._random.sample(valid_positions, min(count, len(valid_positions)))
-            for i, pos in enumerate(chest_positions):
+        if valid_indices:
+            chest_indices = self._random.sample(valid_indices, min(count, len(valid_indices)))
+            for i, index in enumerate(chest_indices):
                 # Higher floors have better loot tables
                 # For now, just store a simple loot tier based on position
                 loot_tier = 1 + (i // 2)  # Every 2 chests increase tier
-                self.chests[pos] = {"opened": False, "loot_tier": loot_tier}
+                self.chests[(index % width, index // width)] = {
+                    "opened": False,
+                    "loot_tier": loot_tier,
+                }
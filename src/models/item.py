@@ -7,7 +7,13 @@ from ..enums import ItemType
 
 
 class Item:
-    """Base class for all game items."""
+    """Base class for all game items.
+
+    Items are slotted; a subclass that adds attributes without naming them
+    in its own ``__slots__`` silently gets a ``__dict__`` again.
+    """
+
+    __slots__ = ("_name", "_item_type", "_item_id")
 
     def __init__(
         self,
@@ -20,7 +26,7 @@ class Item:
         Args:
             name: Name of the item (must be non-empty)
             item_type: Type of item from ItemType enum
-            item_id: Optional unique identifier, auto-generated if not provided
+            item_id: Optional unique identifier, auto-generated on first use if not provided
 
         Raises:
             ValueError: If name is empty or only whitespace
@@ -30,11 +36,15 @@ class Item:
 
         self._name: str = name.strip()
         self._item_type: ItemType = item_type
-        self._item_id: str = item_id or str(uuid.uuid4())
+        # Generating a UUID costs more than the rest of construction, so it is
+        # deferred until the ID is actually read
+        self._item_id: Optional[str] = item_id or None
 
     @property
     def item_id(self) -> str:
         """Get the unique identifier of this item."""
+        if self._item_id is None:
+            self._item_id = str(uuid.uuid4())
         return self._item_id
 
     @property
@@ -1,15 +1,27 @@
 """Location system for world map points of interest."""
 
-from abc import ABC, abstractmethod
-from typing import Set, Tuple
+from functools import lru_cache
+from typing import Dict, Set, Tuple
 
 from src.enums import LocationType, TileType
 from src.models.character import Character
 from src.models.floor import Floor
 
 
-class Location(ABC):
-    """Base class for all world map locations."""
+class Location:
+    """Base class for all world map locations.
+
+    Every location can be entered by default; subclasses override can_enter
+    to add level or progress requirements.
+    """
+
+    # Map symbols for discovered locations, by location type
+    DISPLAY_SYMBOLS: Dict[LocationType, str] = {
+        LocationType.SAFE_HAVEN: "[H]",
+        LocationType.TOWER_ENTRANCE: "[T]",
+        LocationType.DUNGEON_ENTRANCE: "[D]",
+        LocationType.VILLAGE: "[v]",
+    }
 
     def __init__(
         self,
@@ -32,17 +44,18 @@ class Location(ABC):
         self.description = description
         self.discovered = False
 
-    @abstractmethod
     def can_enter(self, character: Character) -> Tuple[bool, str]:
         """Check if character can enter this location.
 
+        Locations are open to everyone unless a subclass says otherwise.
+
         Args:
             character: Character trying to enter
 
         Returns:
             Tuple of (can_enter, reason_if_not)
         """
-        pass
+        return (True, "")
 
     def discover(self) -> None:
         """Mark this location as discovered."""
@@ -52,16 +65,7 @@ class Location(ABC):
         """Get ASCII symbol for map display."""
         if not self.discovered:
             return "?"
-
-        if self.location_type == LocationType.SAFE_HAVEN:
-            return "[H]"
-        elif self.location_type == LocationType.TOWER_ENTRANCE:
-            return "[T]"
-        elif self.location_type == LocationType.DUNGEON_ENTRANCE:
-            return "[D]"
-        elif self.location_type == LocationType.VILLAGE:
-            return "[v]"
-        return "[?]"  # type: ignore[unreachable]
+        return self.DISPLAY_SYMBOLS.get(self.location_type, "[?]")
 
 
 class SafeHaven(Location):
@@ -80,32 +84,41 @@ class SafeHaven(Location):
         self.no_combat = True
         self.spawn_point = (2, 2)  # Center of interior
 
-    def can_enter(self, character: Character) -> Tuple[bool, str]:
-        """Safe Haven can always be entered."""
-        return (True, "")
-
     def create_interior(self) -> Floor:
         """Create the interior layout of Safe Haven.
 
+        The layout is fixed, so it is generated once and copied for each call.
+
         Returns:
             Floor object representing the town interior
         """
-        # Floor uses fixed 20x20 size, we'll use a subset
-        interior = Floor(seed=42)  # Fixed seed for consistency
+        return safe_haven_interior(self.interior_size).copy()
+
 
-        # Generate the floor to populate tiles
-        interior.generate()
+@lru_cache(maxsize=None)
+def safe_haven_interior(interior_size: int) -> Floor:
+    """Generate the Safe Haven interior template; callers must copy it.
 
-        # We'll treat the center 5x5 area as the Safe Haven interior
-        # Clear center area to be all floor tiles
-        center_start = (Floor.FLOOR_WIDTH - self.interior_size) // 2
-        center_end = center_start + self.interior_size
+    Shared by SafeHaven and SafeHavenInterior so both use the same layout.
 
-        for y in range(center_start, center_end):
-            for x in range(center_start, center_end):
-                interior.tiles[(x, y)].tile_type = TileType.FLOOR
+    Args:
+        interior_size: Width and height of the cleared center area
 
-        return interior
+    Returns:
+        Floor shared by every call with the same size
+    """
+    # Floor uses fixed 20x20 size, we'll use a subset
+    interior = Floor(seed=42)  # Fixed seed for consistency
+
+    # Generate the floor to populate tiles
+    interior.generate()
+
+    # We'll treat the center area as the Safe Haven interior
+    # Clear center area to be all floor tiles
+    center_start = (Floor.FLOOR_WIDTH - interior_size) // 2
+    interior.fill_rect(center_start, center_start, interior_size, interior_size, TileType.FLOOR)
+
+    return interior
 
 
 class DungeonEntrance(Location):
@@ -135,6 +148,11 @@ class DungeonEntrance(Location):
         self.floor_count = floor_count
         self.completed_by: Set[str] = set()  # Track character IDs who completed it
 
+        # Show bracket number based on level range
+        # 1-9 = bracket 1, 10-19 = bracket 2, etc.
+        bracket = (max_level // 10) + 1
+        self._bracket_symbol = f"[{bracket}]" if bracket <= 9 else "[D]"
+
     def can_enter(self, character: Character) -> Tuple[bool, str]:
         """Check level requirements for entry.
 
@@ -144,7 +162,7 @@ class DungeonEntrance(Location):
         Returns:
             Tuple of (can_enter, reason_if_not)
         """
-        char_level = getattr(character, "level", 1)  # Default to 1 if no level yet
+        char_level = character.level
 
         if char_level > self.max_level:
             return (
@@ -161,16 +179,7 @@ class DungeonEntrance(Location):
         """Get bracket-specific symbol."""
         if not self.discovered:
             return "?"
-
-        # Show bracket number based on level range
-        # 1-9 = bracket 1, 10-19 = bracket 2, etc.
-        bracket = (self.max_level // 10) + 1
-        if self.max_level == 9:  # Special case for 1-9
-            bracket = 1
-
-        if bracket <= 9:
-            return f"[{bracket}]"
-        return "[D]"
+        return self._bracket_symbol
 
 
 class TowerEntrance(Location):
@@ -199,8 +208,8 @@ class TowerEntrance(Location):
         Returns:
             Tuple of (can_enter, reason_if_not)
         """
-        char_level = getattr(character, "level", 1)
-        dungeons_completed = getattr(character, "dungeons_completed", 0)
+        char_level = character.level
+        dungeons_completed = character.dungeons_completed
 
         if char_level < self.min_level_requirement:
             return (
@@ -22,6 +22,17 @@ class AIBehavior(Enum):
 class Monster(Entity):
     """Represents a monster enemy."""
 
+    __slots__ = (
+        "name",
+        "display_char",
+        "hp_max",
+        "hp",
+        "attack",
+        "defense",
+        "monster_type",
+        "ai_behavior",
+    )
+
     def __init__(
         self,
         x: int,
@@ -49,17 +60,7 @@ class Monster(Entity):
             monster_type: Type identifier (e.g., "goblin", "skeleton")
             ai_behavior: AI behavior pattern
         """
-        super().__init__(x, y, EntityType.MONSTER)
-        self.name = name
-        self.display_char = display_char
-        self.hp_max = hp_max
-        self.hp = min(hp, hp_max)  # Cap HP at max
-        self.attack = attack
-        self.defense = defense
-        self.monster_type = monster_type
-        self.ai_behavior = ai_behavior
-
-        # Validate stats
+        # Validate stats before touching self
         if hp < 0:
             raise ValueError("HP cannot be negative")
         if hp_max <= 0:
@@ -69,6 +70,16 @@ class Monster(Entity):
         if defense < 0:
             raise ValueError("Defense cannot be negative")
 
+        super().__init__(x, y, EntityType.MONSTER)
+        self.name = name
+        self.display_char = display_char
+        self.hp_max = hp_max
+        self.hp = hp if hp < hp_max else hp_max  # Cap HP at max
+        self.attack = attack
+        self.defense = defense
+        self.monster_type = monster_type
+        self.ai_behavior = ai_behavior
+
     def render(self) -> str:
         """Return display character for monster."""
         return self.display_char
@@ -84,7 +95,8 @@ class Monster(Entity):
         Args:
             damage: Amount of damage to apply
         """
-        self.hp = max(0, self.hp - damage)
+        hp = self.hp - damage
+        self.hp = hp if hp > 0 else 0
 
     def is_alive(self) -> bool:
         """Check if monster is still alive."""
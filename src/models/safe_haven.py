@@ -1,11 +1,11 @@
 """Safe Haven interior layout and mechanics."""
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from src.enums import TileType
 from src.models.character import Character
 from src.models.floor import Floor
 from src.models.location import SafeHaven as BaseSafeHaven
+from src.models.location import safe_haven_interior
 
 
 class SafeHavenInterior:
@@ -18,6 +18,11 @@ class SafeHavenInterior:
     STORAGE_VAULTS = (2, 3)  # South
     LOST_SOUL_MEMORIAL = (2, 1)  # North
 
+    # The 5x5 Safe Haven sits in the middle of the interior floor
+    SIZE = 5
+    CENTER_START = (Floor.FLOOR_WIDTH - SIZE) // 2
+    CENTER_END = CENTER_START + SIZE
+
     def __init__(self):
         """Initialize Safe Haven interior."""
         self.no_combat_zone = True
@@ -33,25 +38,12 @@ class SafeHavenInterior:
     def create_detailed_interior(self) -> Floor:
         """Create detailed interior layout with named zones.
 
+        The layout is fixed, so it is generated once and copied for each call.
+
         Returns:
             Floor object with proper zone layout
         """
-        # Create base floor
-        interior = Floor(seed=42)  # Fixed seed for consistency
-        interior.generate()
-
-        # Clear the 5x5 center area
-        center_start = (Floor.FLOOR_WIDTH - 5) // 2
-        center_end = center_start + 5
-
-        # Set all tiles in Safe Haven to floor
-        for y in range(center_start, center_end):
-            for x in range(center_start, center_end):
-                interior.tiles[(x, y)].tile_type = TileType.FLOOR
-
-        # Mark special zones (could be enhanced with NPCs/objects later)
-        # For now, we'll just ensure they're accessible
-        return interior
+        return safe_haven_interior(self.SIZE).copy()
 
     def get_zone_at(self, position: Tuple[int, int]) -> Optional[str]:
         """Get the zone name at a given position.
@@ -63,11 +55,8 @@ class SafeHavenInterior:
             Zone name or None if not in a special zone
         """
         # Convert world position to local 5x5 coordinates
-        center_start = (Floor.FLOOR_WIDTH - 5) // 2
-        local_x = position[0] - center_start
-        local_y = position[1] - center_start
-
-        return self.zones.get((local_x, local_y))
+        start = self.CENTER_START
+        return self.zones.get((position[0] - start, position[1] - start))
 
     def is_in_safe_haven(self, position: Tuple[int, int]) -> bool:
         """Check if position is within Safe Haven boundaries.
@@ -78,10 +67,22 @@ class SafeHavenInterior:
         Returns:
             True if within Safe Haven interior
         """
-        center_start = (Floor.FLOOR_WIDTH - 5) // 2
-        center_end = center_start + 5
+        start = self.CENTER_START
+        end = self.CENTER_END
+        return start <= position[0] < end and start <= position[1] < end
 
-        return center_start <= position[0] < center_end and center_start <= position[1] < center_end
+    def is_in_safe_haven_many(self, positions: Iterable[Tuple[int, int]]) -> List[bool]:
+        """Check several positions at once, e.g. every monster on the floor.
+
+        Args:
+            positions: (x, y) positions to check
+
+        Returns:
+            List of is_in_safe_haven results in the same order
+        """
+        start = self.CENTER_START
+        end = self.CENTER_END
+        return [start <= x < end and start <= y < end for x, y in positions]
 
     def can_attack(self, attacker: Character, target_pos: Tuple[int, int]) -> Tuple[bool, str]:
         """Check if attack is allowed in Safe Haven.
@@ -106,8 +107,6 @@ class SafeHavenInterior:
         Returns:
             (x, y) respawn position in world coordinates
         """
-        center_start = (Floor.FLOOR_WIDTH - 5) // 2
-
         if is_lost_soul:
             # Lost Souls spawn at memorial
             local_pos = self.LOST_SOUL_MEMORIAL
@@ -115,7 +114,7 @@ class SafeHavenInterior:
             # New characters spawn at plaza
             local_pos = self.SPAWN_PLAZA
 
-        return (center_start + local_pos[0], center_start + local_pos[1])
+        return (self.CENTER_START + local_pos[0], self.CENTER_START + local_pos[1])
 
 
 class EnhancedSafeHaven(BaseSafeHaven):
@@ -8,9 +8,18 @@ if TYPE_CHECKING:
     from .entity import Entity
     from .item import Item
 
+# Tile types a Tile reports as walkable, tested with one AND
+_TILE_WALKABLE_MASK = TileType.FLOOR | TileType.STAIRS_UP
+
 
 class Tile:
-    """Represents a single position on the game map."""
+    """Represents a single position on the game map.
+
+    A floor holds one Tile per cell, so instances use slots rather than a
+    per-instance ``__dict__``.
+    """
+
+    __slots__ = ("_position", "_tile_type", "_occupant", "_item")
 
     def __init__(self, x: int, y: int, tile_type: TileType):
         """Initialize a tile with immutable position and type.
@@ -86,7 +95,7 @@ class Tile:
         Returns:
             True if the tile is FLOOR or STAIRS_UP, False otherwise
         """
-        return self._tile_type in (TileType.FLOOR, TileType.STAIRS_UP)
+        return bool(self._tile_type & _TILE_WALKABLE_MASK)
 
     def __str__(self) -> str:
         """Return string representation of the tile."""
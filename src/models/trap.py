@@ -5,7 +5,7 @@ Part of Phase 4.1 Monster Implementation
 """
 
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from src.models.character import Character
@@ -20,7 +20,12 @@ class TrapType(Enum):
 
 
 class Trap:
-    """Represents a trap hazard on the floor."""
+    """Represents a trap hazard on the floor.
+
+    Uses slots since a floor can hold many traps.
+    """
+
+    __slots__ = ("x", "y", "trap_type", "damage", "floor_level", "triggered", "_display_char")
 
     # Display characters for each trap type
     DISPLAY_CHARS = {
@@ -32,6 +37,13 @@ class Trap:
     # Base damage values for each trap type
     BASE_DAMAGE = {TrapType.SPIKE: 5, TrapType.POISON: 3, TrapType.ALARM: 0}
 
+    # Description templates for each trap type, filled in with the trap's damage
+    DESCRIPTIONS = {
+        TrapType.SPIKE: "A spike trap ({damage} damage)",
+        TrapType.POISON: "A poison gas trap ({damage} damage + poison)",
+        TrapType.ALARM: "An alarm trap (alerts monsters)",
+    }
+
     def __init__(
         self,
         x: int,
@@ -55,6 +67,9 @@ class Trap:
         self.damage = damage
         self.floor_level = floor_level
         self.triggered = False
+        # Enum members hash through a Python-level __hash__, so resolve the
+        # display character once instead of on every render
+        self._display_char = self.DISPLAY_CHARS[trap_type]
 
     @property
     def position(self) -> tuple[int, int]:
@@ -79,6 +94,28 @@ class Trap:
         scaled_damage = base_damage + (floor_level - 1) // 2
         return cls(x, y, trap_type, scaled_damage, floor_level)
 
+    @classmethod
+    def create_scaled_batch(
+        cls, placements: Iterable[Tuple[int, int, TrapType]], floor_level: int
+    ) -> List["Trap"]:
+        """Create many traps for one floor, scaling damage as in create_scaled.
+
+        The scaled damage for each trap type is worked out once for the whole
+        batch rather than per trap.
+
+        Args:
+            placements: (x, y, trap_type) for each trap
+            floor_level: Floor level for scaling
+
+        Returns:
+            New trap instances in the same order as placements
+        """
+        bonus = (floor_level - 1) // 2
+        damage = {trap_type: base + bonus for trap_type, base in cls.BASE_DAMAGE.items()}
+        return [
+            cls(x, y, trap_type, damage[trap_type], floor_level) for x, y, trap_type in placements
+        ]
+
     def trigger(self, character: "Character") -> Optional[Dict[str, Any]]:
         """Trigger the trap effect on a character.
 
@@ -93,41 +130,46 @@ class Trap:
 
         self.triggered = True
         result: Dict[str, Any] = {"damage": self.damage, "effect": ""}
-
-        if self.trap_type == TrapType.SPIKE:
-            # Direct damage
-            character.take_damage(self.damage)
-            result["effect"] = "spike_damage"
-
-        elif self.trap_type == TrapType.POISON:
-            # Damage + poison status
-            character.take_damage(self.damage)
-            if hasattr(character, "apply_status"):
-                character.apply_status("poisoned", duration=3)
-            result["effect"] = "poisoned"
-
-        elif self.trap_type == TrapType.ALARM:
-            # Alert monsters in radius
-            result["effect"] = "alarm_triggered"
-            result["alert_radius"] = 10
-            result["alert_position"] = self.position
-
+        self._TRIGGER_HANDLERS[self.trap_type](self, character, result)
         return result
 
+    def _trigger_spike(self, character: "Character", result: Dict[str, Any]) -> None:
+        """Apply a spike trap: direct damage."""
+        character.take_damage(self.damage)
+        result["effect"] = "spike_damage"
+
+    def _trigger_poison(self, character: "Character", result: Dict[str, Any]) -> None:
+        """Apply a poison trap: damage plus poison status."""
+        character.take_damage(self.damage)
+        # Single lookup instead of hasattr followed by the call's own lookup
+        apply_status = getattr(character, "apply_status", None)
+        if apply_status is not None:
+            apply_status("poisoned", duration=3)
+        result["effect"] = "poisoned"
+
+    def _trigger_alarm(self, character: "Character", result: Dict[str, Any]) -> None:
+        """Apply an alarm trap: alert monsters in radius."""
+        result["effect"] = "alarm_triggered"
+        result["alert_radius"] = 10
+        result["alert_position"] = self.position
+
+    # Effect handler for each trap type; one dict lookup instead of an
+    # if/elif ladder of enum comparisons
+    _TRIGGER_HANDLERS = {
+        TrapType.SPIKE: _trigger_spike,
+        TrapType.POISON: _trigger_poison,
+        TrapType.ALARM: _trigger_alarm,
+    }
+
     def render(self) -> str:
         """Return display character for trap."""
         if self.triggered:
             return "."
-        return self.DISPLAY_CHARS[self.trap_type]
+        return self._display_char
 
     def description(self) -> str:
         """Get trap description."""
         if self.triggered:
             return f"A triggered {self.trap_type.value} trap"
 
-        descriptions = {
-            TrapType.SPIKE: f"A spike trap ({self.damage} damage)",
-            TrapType.POISON: f"A poison gas trap ({self.damage} damage + poison)",
-            TrapType.ALARM: "An alarm trap (alerts monsters)",
-        }
-        return descriptions[self.trap_type]
+        return self.DESCRIPTIONS[self.trap_type].format(damage=self.damage)
@@ -1,14 +1,73 @@
 """World map system for overworld navigation."""
 
+import math
 import random
-from typing import Dict, List, Optional, Set, Tuple
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, List, Optional, Set, Tuple, TypeVar
 
 from src.enums import TerrainType
 
+T = TypeVar("T")
+
+
+def terrain_table(values: Dict[TerrainType, T], default: T) -> Tuple[T, ...]:
+    """Flatten a terrain-keyed dict into a tuple indexed by terrain value.
+
+    Args:
+        values: Per-terrain values
+        default: Value for terrains missing from the dict
+
+    Returns:
+        Tuple where entry ``terrain`` holds that terrain's value. TerrainType
+        values start at 1, so entry 0 always holds the default.
+    """
+    table = [default] * (max(TerrainType) + 1)
+    for terrain, value in values.items():
+        table[terrain] = value
+    return tuple(table)
+
+
+@lru_cache(maxsize=None)
+def _disk_spans(radius: int) -> Tuple[Tuple[int, int], ...]:
+    """Get the rows of a circle as horizontal spans.
+
+    Args:
+        radius: Circle radius in tiles
+
+    Returns:
+        (dy, half_width) per row, where the row covers dx in
+        [-half_width, half_width] and dx*dx + dy*dy <= radius*radius
+    """
+    radius_sq = radius * radius
+    return tuple((dy, math.isqrt(radius_sq - dy * dy)) for dy in range(-radius, radius + 1))
+
+
+@lru_cache(maxsize=None)
+def _cluster_offsets(size: int) -> Tuple[Tuple[int, int, float], ...]:
+    """Get the offsets a terrain cluster of this radius may cover.
+
+    Args:
+        size: Cluster radius in tiles
+
+    Returns:
+        (dx, dy, threshold) in row-major order for offsets within the radius,
+        where a random draw above threshold places the terrain
+    """
+    offsets = []
+    for dy in range(-size, size + 1):
+        for dx in range(-size, size + 1):
+            distance = (dx * dx + dy * dy) ** 0.5
+            if distance <= size:
+                offsets.append((dx, dy, distance / (size * 1.5)))
+    return tuple(offsets)
+
 
 class WorldTile:
     """Represents a single tile on the world map."""
 
+    __slots__ = ("x", "y", "terrain_type", "location", "discovered")
+
     def __init__(self, x: int, y: int, terrain_type: TerrainType):
         """Initialize a world tile.
 
@@ -50,6 +109,7 @@ class WorldMap:
         TerrainType.SHADOWLANDS: 2,
         TerrainType.WATER: 4,
     }
+    _VISION_RADIUS_TABLE = terrain_table(VISION_RADIUS_BY_TERRAIN, 3)
 
     def __init__(self, seed: Optional[int] = None):
         """Initialize the world map.
@@ -59,16 +119,14 @@ class WorldMap:
         """
         self.seed = seed if seed is not None else random.randint(0, 999999)
         self.rng = random.Random(self.seed)
-        self.tiles: List[List[WorldTile]] = []
+        self.tiles: List[List[WorldTile]] = [
+            [WorldTile(x, y, TerrainType.PLAINS) for x in range(self.WIDTH)]
+            for y in range(self.HEIGHT)
+        ]
         self.safe_haven_position = (self.CENTER_X, self.CENTER_Y)
         self.discovered_tiles: Set[Tuple[int, int]] = set()
-
-        # Initialize empty grid
-        for y in range(self.HEIGHT):
-            row = []
-            for x in range(self.WIDTH):
-                row.append(WorldTile(x, y, TerrainType.PLAINS))
-            self.tiles.append(row)
+        # Row-major passability flags, rebuilt lazily after terrain changes
+        self._passable: Optional[bytearray] = None
 
     def generate_world(self) -> None:
         """Generate the world terrain."""
@@ -85,6 +143,31 @@ class WorldMap:
         # Place Safe Haven
         self._place_safe_haven()
 
+        self.mark_terrain_changed()
+
+    def mark_terrain_changed(self) -> None:
+        """Invalidate caches derived from tile terrain.
+
+        generate_world calls this itself; code that sets ``terrain_type`` on
+        tiles directly should call it too.
+        """
+        self._passable = None
+
+    def passable_mask(self) -> bytearray:
+        """Get passability of every tile as a row-major flag array.
+
+        Built from WorldTile.is_passable and cached. Setting ``terrain_type``
+        on a tile does not update it: until mark_terrain_changed is called,
+        the mask (and WorldNavigation.can_move_to, which reads it) still
+        reports the old terrain.
+
+        Returns:
+            Bytearray where index ``y * WIDTH + x`` is 1 if that tile is passable
+        """
+        if self._passable is None:
+            self._passable = bytearray(tile.is_passable() for row in self.tiles for tile in row)
+        return self._passable
+
     def _generate_base_terrain(self) -> None:
         """Fill world with base terrain (plains)."""
         # Already done in __init__, but method here for clarity
@@ -116,12 +199,15 @@ class WorldMap:
 
     def _generate_shadowlands(self) -> None:
         """Generate dangerous shadowlands on the edges."""
-        # Outer edges become shadowlands
-        for y in range(self.HEIGHT):
-            for x in range(self.WIDTH):
-                distance_from_edge = min(x, y, self.WIDTH - x - 1, self.HEIGHT - y - 1)
-                if distance_from_edge < 3:
-                    self.tiles[y][x].terrain_type = TerrainType.SHADOWLANDS
+        # Outer edges become shadowlands: a band 3 tiles deep. Only the band
+        # is visited; full rows at the top and bottom, the end columns between.
+        band = 3
+        shadowlands = TerrainType.SHADOWLANDS
+        edge_columns = [x for x in range(self.WIDTH) if x < band or x >= self.WIDTH - band]
+        for y, row in enumerate(self.tiles):
+            edge_row = y < band or y >= self.HEIGHT - band
+            for x in range(self.WIDTH) if edge_row else edge_columns:
+                row[x].terrain_type = shadowlands
 
     def _generate_roads(self) -> None:
         """Generate roads connecting key areas."""
@@ -161,15 +247,14 @@ class WorldMap:
             max_size: Maximum radius
         """
         size = self.rng.randint(min_size, max_size)
-        for dy in range(-size, size + 1):
-            for dx in range(-size, size + 1):
-                x = center_x + dx
-                y = center_y + dy
-                if 0 <= x < self.WIDTH and 0 <= y < self.HEIGHT:
-                    # Use distance to create roughly circular clusters
-                    distance = (dx * dx + dy * dy) ** 0.5
-                    if distance <= size and self.rng.random() > distance / (size * 1.5):
-                        self.tiles[y][x].terrain_type = terrain_type
+        tiles = self.tiles
+        rng_random = self.rng.random
+        # Roughly circular clusters, thinning out towards the edge
+        for dx, dy, threshold in _cluster_offsets(size):
+            x = center_x + dx
+            y = center_y + dy
+            if 0 <= x < self.WIDTH and 0 <= y < self.HEIGHT and rng_random() > threshold:
+                tiles[y][x].terrain_type = terrain_type
 
     def _place_safe_haven(self) -> None:
         """Clear area around Safe Haven."""
@@ -217,15 +302,20 @@ class WorldMap:
             center_y: Center Y coordinate
             radius: Vision radius
         """
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                x = center_x + dx
-                y = center_y + dy
-                if self.is_valid_position(x, y):
-                    distance = (dx * dx + dy * dy) ** 0.5
-                    if distance <= radius:
-                        self.tiles[y][x].discovered = True
-                        self.discovered_tiles.add((x, y))
+        tiles = self.tiles
+        discovered_tiles = self.discovered_tiles
+        # Clip each row of the circle to the map once instead of every tile
+        for dy, half_width in _disk_spans(radius):
+            y = center_y + dy
+            if not 0 <= y < self.HEIGHT:
+                continue
+            row = tiles[y]
+            columns = range(
+                max(center_x - half_width, 0), min(center_x + half_width + 1, self.WIDTH)
+            )
+            for x in columns:
+                row[x].discovered = True
+            discovered_tiles.update(zip(columns, repeat(y)))
 
     def is_discovered(self, x: int, y: int) -> bool:
         """Check if a tile has been discovered.
@@ -248,4 +338,4 @@ class WorldMap:
         Returns:
             Vision radius in tiles
         """
-        return self.VISION_RADIUS_BY_TERRAIN.get(terrain, 3)
+        return self._VISION_RADIUS_TABLE[terrain or 0]
@@ -1,6 +1,8 @@
 """Simplified ASCII renderer using KISS color system."""
 
-from typing import Optional, Tuple
+import math
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from src.colors import (
     apply_deuteranopia,
@@ -19,6 +21,39 @@ from src.models.character import Character
 from src.models.floor import Floor
 
 
+@lru_cache(maxsize=None)
+def _visibility_table(fog_radius: int) -> Tuple[float, ...]:
+    """Get the fog of war dimming for every squared distance in view.
+
+    Args:
+        fog_radius: Radius of fog of war visibility
+
+    Returns:
+        Tuple indexed by squared distance from the player, covering distances
+        0 to fog_radius**2; anything past the end is hidden by fog
+    """
+    max_dist_squared = fog_radius**2
+    if max_dist_squared == 0:
+        return (1.0,)
+    return tuple(
+        max(0.3, 1.0 - (dist_squared / max_dist_squared))
+        for dist_squared in range(max_dist_squared + 1)
+    )
+
+
+def _tile_glyphs(char_map: Dict[Any, str]) -> bytes:
+    """Build a translate table from tile type values to display characters.
+
+    Args:
+        char_map: Display characters keyed by TileType
+
+    Returns:
+        256-byte table for bytes.translate; 0 (no tile) maps to a space and
+        unmapped tile types to "?"
+    """
+    return bytes(ord(char_map.get(code, "?")) if code else ord(" ") for code in range(256))
+
+
 class ASCIIRenderer:
     """Renders floors in ASCII format with fog of war and color support."""
 
@@ -34,6 +69,7 @@ class ASCIIRenderer:
         "chest": "C",
         "fog": "?",
     }
+    _TILE_GLYPHS = _tile_glyphs(CHAR_MAP)
 
     @classmethod
     def render_static(
@@ -82,6 +118,9 @@ class ASCIIRenderer:
         Returns:
             ASCII representation of the floor
         """
+        if not self.color_enabled:
+            return self._render_plain(floor, player_pos)
+
         lines = []
 
         for y in range(floor.height):
@@ -100,6 +139,72 @@ class ASCIIRenderer:
 
         return "\n".join(lines)
 
+    def _render_plain(self, floor: Floor, player_pos: Optional[Tuple[int, int]]) -> str:
+        """Render without colors by translating the floor's tile type plane.
+
+        Each row is translated to characters in one call, fog is applied as
+        one span per row, and markers are then written over their cells. The
+        plane is read fresh on every call, so tiles changed directly still
+        render as they are now.
+
+        Args:
+            floor: The floor to render
+            player_pos: Optional player position for fog of war
+
+        Returns:
+            ASCII representation of the floor, the same as the per-cell path
+        """
+        width = floor.width
+        height = floor.height
+        plane = floor.build_tile_type_plane()
+        glyphs = self._TILE_GLYPHS
+        rows = [
+            plane[row_start : row_start + width].translate(glyphs)
+            for row_start in range(0, height * width, width)
+        ]
+
+        radius_sq = self.fog_radius**2
+        if player_pos:
+            fog = self.CHAR_MAP["fog"].encode()
+            px, py = player_pos
+            for y, row in enumerate(rows):
+                dy = y - py
+                remaining = radius_sq - dy * dy
+                if remaining < 0:
+                    row[:] = fog * width
+                    continue
+                half_width = math.isqrt(remaining)
+                start = min(max(px - half_width, 0), width)
+                end = max(min(px + half_width + 1, width), start)
+                row[:start] = fog * start
+                row[end:] = fog * (width - end)
+
+        def draw(position: Tuple[int, int], char: str) -> None:
+            x, y = position
+            if 0 <= x < width and 0 <= y < height:
+                if player_pos:
+                    dx = x - player_pos[0]
+                    dy = y - player_pos[1]
+                    if dx * dx + dy * dy > radius_sq:
+                        return
+                rows[y][x] = ord(char)
+
+        # Lowest priority first, so later markers cover earlier ones
+        for position, entity in floor.entities.items():
+            draw(position, self._get_entity_char(entity))
+        for position, trap_data in floor.traps.items():
+            if trap_data.get("revealed", False):
+                draw(position, self.CHAR_MAP["trap"])
+        for position in floor.chests:
+            draw(position, self.CHAR_MAP["chest"])
+        if hasattr(floor, "monsters"):
+            for position in floor.monsters:
+                draw(position, self.CHAR_MAP["monster"])
+        if player_pos:
+            draw(player_pos, self.CHAR_MAP["player"])
+
+        return "\n".join(row.decode() for row in rows)
+
     def _get_tile_display(
         self, floor: Floor, x: int, y: int, player_pos: Optional[Tuple[int, int]]
     ) -> Tuple[str, Optional[Tuple[int, int, int]]]:
@@ -114,10 +219,15 @@ class ASCIIRenderer:
             Tuple of (character, color)
         """
         # Check if tile is visible (fog of war)
+        visibility = 1.0
         if player_pos:
-            dist_squared = (x - player_pos[0]) ** 2 + (y - player_pos[1]) ** 2
-            if dist_squared > self.fog_radius**2:
+            dx = x - player_pos[0]
+            dy = y - player_pos[1]
+            dist_squared = dx * dx + dy * dy
+            visibility_table = _visibility_table(self.fog_radius)
+            if dist_squared >= len(visibility_table):
                 return self.CHAR_MAP["fog"], (64, 64, 64)  # Dark gray for fog
+            visibility = visibility_table[dist_squared]
 
         # Check if player is at this position
         if player_pos and (x, y) == player_pos:
@@ -128,27 +238,26 @@ class ASCIIRenderer:
             return self.CHAR_MAP["monster"], (255, 0, 0) if self.color_enabled else None
 
         # Check for chests
-        if hasattr(floor, "chests") and (x, y) in floor.chests:
+        if (x, y) in floor.chests:
             return self.CHAR_MAP["chest"], (255, 215, 0) if self.color_enabled else None
 
         # Check for traps (only show if revealed)
-        if hasattr(floor, "traps") and (x, y) in floor.traps:
+        if (x, y) in floor.traps:
             trap_data = floor.traps[(x, y)]
             if trap_data.get("revealed", False):
                 return self.CHAR_MAP["trap"], (255, 0, 255) if self.color_enabled else None
 
-        # Check for entities
-        if hasattr(floor, "entities"):
-            for entity in floor.entities:
-                if entity.x == x and entity.y == y:
-                    char = self._get_entity_char(entity)
-                    color = None
-                    if self.color_enabled:
-                        color = get_entity_color(entity.entity_type)
-                        # Apply status effects if present
-                        if hasattr(entity, "status") and entity.status:
-                            color = apply_status_tint(color, entity.status)
-                    return char, color
+        # Check for entities (Floor.entities is keyed by position)
+        entity = floor.entities.get((x, y))
+        if entity is not None:
+            char = self._get_entity_char(entity)
+            color = None
+            if self.color_enabled:
+                color = get_entity_color(entity.entity_type)
+                # Apply status effects if present
+                if hasattr(entity, "status") and entity.status:
+                    color = apply_status_tint(color, entity.status)
+            return char, color
 
         # Get tile from floor.tiles
         if (x, y) in floor.tiles:
@@ -157,12 +266,7 @@ class ASCIIRenderer:
             char = self.CHAR_MAP.get(tile_type, "?")
             color = None
             if self.color_enabled:
-                # Apply fog of war dimming
-                visibility = 1.0
-                if player_pos:
-                    dist_squared = (x - player_pos[0]) ** 2 + (y - player_pos[1]) ** 2
-                    max_dist_squared = self.fog_radius**2
-                    visibility = max(0.3, 1.0 - (dist_squared / max_dist_squared))
+                # Fog of war dimming was looked up above
                 color = get_tile_color(tile_type, visibility)
             return char, color
         else:
@@ -1,8 +1,10 @@
 """Tests for ASCII visualization and map features - UTF Contracts GAME-MAP-005, 006, 007."""
 
 from src.enums import TileType
-from src.models.floor import Floor
-from src.renderers.ascii_renderer import ASCIIRenderer
+from src.models.floor import Floor, Room
+from src.models.monster import AIBehavior, Monster
+from src.models.tile import Tile
+from src.renderers.ascii_renderer import ASCIIRenderer, _visibility_table
 
 
 class TestASCIIRenderer:
@@ -124,6 +126,60 @@ class TestASCIIRenderer:
         lines = result2.split("\n")
         assert lines[5][5] == "@"
 
+    def test_entities_looked_up_by_position(self):
+        """Test entities stored by position on the floor are rendered at that cell."""
+        floor = Floor(seed=12345)
+        floor.generate()
+        floor.entities = {(5, 5): Monster(5, 5, "Rat", "r", 5, 5, 1, 0, "rat", AIBehavior.PASSIVE)}
+
+        lines = ASCIIRenderer.render_static(floor, (3, 3), vision_radius=10).split("\n")
+
+        assert lines[5][5] == "M"
+
+    def test_plain_render_follows_direct_tile_changes(self):
+        """Test the plain renderer shows tiles changed without marking the floor."""
+        floor = Floor(seed=12345)
+        floor.generate()
+        room = floor.rooms[0]
+        position = (room.x + 1, room.y + 1)
+        ASCIIRenderer().render(floor)
+        floor.tile_type_plane()
+
+        floor.tiles[position].tile_type = TileType.STAIRS_DOWN
+        floor.tiles[(0, 0)] = Tile(0, 0, TileType.FLOOR)
+        floor.chests = {(room.x, room.y): {"tier": 1}}
+        floor.monsters = {(room.x, room.y): {"type": "goblin"}}
+        lines = ASCIIRenderer.render_static(floor, position, vision_radius=3).split("\n")
+
+        assert lines[room.y + 1][room.x + 1] == "@"
+        assert lines[room.y][room.x] == "M"  # Monsters cover chests
+
+        lines = ASCIIRenderer().render(floor).split("\n")
+        assert lines[room.y + 1][room.x + 1] == "v"
+        assert lines[0][0] == "."
+
+    def test_plain_render_of_larger_floor(self):
+        """Test floors larger than the default size render every tile."""
+        floor = Floor(seed=12345, width=30, height=30)
+        floor.generate()
+        floor.connect_rooms()
+
+        lines = ASCIIRenderer().render(floor).split("\n")
+
+        assert len(lines) == 30
+        for (x, y), tile in floor.tiles.items():
+            assert lines[y][x] == ASCIIRenderer.CHAR_MAP[tile.tile_type]
+
+    def test_visibility_table_covers_fog_radius(self):
+        """Test the dimming table spans the fog radius and fades to its floor."""
+        table = _visibility_table(4)
+
+        assert len(table) == 4 * 4 + 1
+        assert table[0] == 1.0
+        assert table[8] == 0.5
+        assert table[16] == 0.3
+        assert list(table) == sorted(table, reverse=True)
+
 
 class TestTrapPlacement:
     """Tests for trap placement functionality."""
@@ -206,6 +262,23 @@ class TestTrapPlacement:
         for trap_pos in floor.traps:
             assert trap_pos not in room_centers
 
+    def test_traps_cover_larger_floors(self):
+        """Test every floor tile of a larger floor is a trap candidate."""
+        floor = Floor(seed=12345, width=30, height=30)
+        floor.generate()
+        floor.connect_rooms()
+
+        floor.place_traps(density=1.0)
+
+        room_centers = {(room.center_x, room.center_y) for room in floor.rooms}
+        expected = {
+            position
+            for position, tile in floor.tiles.items()
+            if tile.tile_type == TileType.FLOOR and position not in room_centers
+        }
+        assert set(floor.traps) == expected
+        assert any(x >= 20 or y >= 20 for x, y in floor.traps)
+
     def test_trap_properties(self):
         """Test that traps have correct properties."""
         floor = Floor(seed=12345)
@@ -299,6 +372,23 @@ class TestChestGeneration:
                     assert y > room.y and y < room.y + room.height - 1
                     break
 
+    def test_chests_placed_in_rooms_of_larger_floors(self):
+        """Test rooms outside the default 20x20 area can hold chests."""
+        floor = Floor(seed=12345, width=30, height=30)
+        floor.generate()
+        room = Room(22, 22, 5, 5)
+        floor.rooms = [room]
+        for y in range(room.y, room.y2 + 1):
+            for x in range(room.x, room.x2 + 1):
+                floor.tiles[(x, y)].tile_type = TileType.FLOOR
+        floor.mark_tiles_changed()
+
+        floor.place_chests(count=3)
+
+        assert len(floor.chests) == 3
+        for x, y in floor.chests:
+            assert 23 <= x <= 25 and 23 <= y <= 25
+
     def test_chest_properties(self):
         """Test that chests have correct properties."""
         floor = Floor(seed=12345)
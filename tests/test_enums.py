@@ -2,7 +2,14 @@
 
 import pytest
 
-from src.enums import Direction, EntityType, ItemType, TileType
+from src.enums import (
+    SPAWNABLE_MASK,
+    WALKABLE_MASK,
+    Direction,
+    EntityType,
+    ItemType,
+    TileType,
+)
 
 
 class TestTileType:
@@ -24,6 +31,13 @@ class TestTileType:
         with pytest.raises(AttributeError):
             TileType.FLOOR.value = 999  # type: ignore[misc]
 
+    def test_tile_type_masks(self):
+        """Test walkable and spawnable masks select the right tile types."""
+        walkable = {t for t in TileType if t & WALKABLE_MASK}
+        assert walkable == {TileType.FLOOR, TileType.STAIRS_UP, TileType.STAIRS_DOWN}
+        spawnable = {t for t in TileType if t & SPAWNABLE_MASK}
+        assert spawnable == {TileType.FLOOR}
+
 
 class TestDirection:
     """Tests for Direction enum."""
@@ -21,6 +21,12 @@ class TestRoom:
         assert room.x2 == 8  # 5 + 4 - 1
         assert room.y2 == 15  # 10 + 6 - 1
 
+    def test_room_center(self):
+        """Test that the room center is stored and matches center()."""
+        room = Room(5, 10, 4, 7)
+        assert (room.center_x, room.center_y) == (7, 13)
+        assert room.center() == (7, 13)
+
     def test_room_overlap_detection(self):
         """Test room overlap detection."""
         room1 = Room(5, 5, 4, 4)
@@ -71,6 +77,9 @@ class TestFloor:
         assert floor.seed == 12345
         assert floor.tiles == {}
         assert floor.rooms == []
+        assert floor.traps == {}
+        assert floor.chests == {}
+        assert floor.entities == {}
 
     def test_floor_dimensions(self):
         """Test floor dimension constants."""
@@ -274,3 +283,82 @@ class TestRoomGeneration:
             right_tile = floor.get_tile(19, y)
             assert left_tile.tile_type == TileType.WALL
             assert right_tile.tile_type == TileType.WALL
+
+    def test_tile_type_plane_matches_tiles(self):
+        """Test the flat tile type plane mirrors tiles and refreshes on change."""
+        floor = Floor(12345)
+        floor.generate()
+
+        plane = floor.tile_type_plane()
+        assert len(plane) == Floor.FLOOR_WIDTH * Floor.FLOOR_HEIGHT
+        for (x, y), tile in floor.tiles.items():
+            assert plane[y * Floor.FLOOR_WIDTH + x] == tile.tile_type
+        assert floor.tile_type_plane() is plane
+
+        floor.tiles[(1, 1)].tile_type = TileType.STAIRS_UP
+        floor.mark_tiles_changed()
+        assert floor.tile_type_plane()[Floor.FLOOR_WIDTH + 1] == TileType.STAIRS_UP
+
+    def test_fill_rect_retypes_area(self):
+        """Test fill_rect sets a clipped rectangle and refreshes derived data."""
+        floor = Floor(12345)
+        floor.generate()
+        tile = floor.tiles[(0, 0)]
+        plane = floor.tile_type_plane()
+
+        floor.fill_rect(-2, -2, 5, 5, TileType.FLOOR)
+
+        assert floor.tiles[(0, 0)] is tile
+        for y in range(3):
+            for x in range(3):
+                assert floor.tiles[(x, y)].tile_type == TileType.FLOOR
+        assert floor.tiles[(3, 0)].tile_type == TileType.WALL
+        assert floor.tile_type_plane() is not plane
+
+    def test_fill_rect_clips_to_floor_size(self):
+        """Test fill_rect reaches past the default size on a larger floor."""
+        floor = Floor(1, 30, 30)
+        floor.generate()
+
+        floor.fill_rect(18, 18, 6, 6, TileType.FLOOR)
+
+        assert floor.tiles[(22, 22)].tile_type == TileType.FLOOR
+        assert floor.tiles[(23, 23)].tile_type == TileType.FLOOR
+
+        floor.fill_rect(27, 27, 10, 10, TileType.WALL)
+        assert floor.tiles[(29, 29)].tile_type == TileType.WALL
+        assert (30, 30) not in floor.tiles
+
+    def test_walkable_mask_matches_tiles(self):
+        """Test the walkable mask flags floor and stairs tiles and refreshes on change."""
+        floor = Floor(12345)
+        floor.generate()
+
+        mask = floor.walkable_mask()
+        for (x, y), tile in floor.tiles.items():
+            expected = tile.tile_type in (TileType.FLOOR, TileType.STAIRS_UP, TileType.STAIRS_DOWN)
+            assert mask[y * Floor.FLOOR_WIDTH + x] == expected
+        assert floor.walkable_mask() is mask
+
+        floor.fill_rect(0, 0, 1, 1, TileType.STAIRS_DOWN)
+        assert floor.walkable_mask()[0] == 1
+
+    def test_copy_is_independent(self):
+        """Test a copied floor has the same layout but its own tiles and state."""
+        floor = Floor(12345)
+        floor.generate()
+        floor.connect_rooms()
+        floor.place_traps(density=0.2)
+
+        clone = floor.copy()
+
+        assert clone.seed == floor.seed
+        assert clone.rooms == floor.rooms
+        assert clone.traps == floor.traps
+        for position, tile in floor.tiles.items():
+            assert clone.tiles[position] is not tile
+            assert clone.tiles[position].tile_type == tile.tile_type
+        assert clone._random.random() == floor._random.random()
+
+        clone.tiles[(0, 0)].tile_type = TileType.FLOOR
+        assert floor.tiles[(0, 0)].tile_type == TileType.WALL
@@ -134,3 +134,18 @@ class TestFogOfWar:
         # But edges at radius should be revealed
         assert world.is_discovered(center_x + radius, center_y)
         assert world.is_discovered(center_x, center_y + radius)
+
+    def test_reveal_area_matches_full_scan(self):
+        """Test offset-table reveal marks exactly the tiles within the radius."""
+        world = WorldMap(seed=42)
+        center_x, center_y, radius = 2, 3, 5
+
+        world.reveal_area(center_x, center_y, radius)
+
+        expected = {
+            (x, y)
+            for y in range(world.HEIGHT)
+            for x in range(world.WIDTH)
+            if (x - center_x) ** 2 + (y - center_y) ** 2 <= radius * radius
+        }
+        assert world.discovered_tiles == expected
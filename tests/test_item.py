@@ -28,6 +28,12 @@ class TestItem:
         assert len(item1.item_id) == 36
         assert item1.item_id.count("-") == 4
 
+    def test_item_id_stable_once_generated(self):
+        """Test a generated item ID does not change between reads."""
+        item = Item("Potion", ItemType.CONSUMABLE)
+
+        assert item.item_id == item.item_id
+
     def test_item_id_provided(self):
         """Test that custom item IDs can be provided."""
         custom_id = "custom-item-id-456"
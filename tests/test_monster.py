@@ -224,3 +224,19 @@ class TestMonster:
                 monster_type="test",
                 ai_behavior=AIBehavior.PASSIVE,
             )
+
+    def test_invalid_stats_report_the_failing_stat(self):
+        """Test each invalid stat is rejected with its own message."""
+        valid = {"hp": 5, "hp_max": 5, "attack": 1, "defense": 1}
+        cases = [
+            ("hp", -1, "HP cannot be negative"),
+            ("hp_max", 0, "Max HP must be positive"),
+            ("attack", -1, "Attack cannot be negative"),
+            ("defense", -1, "Defense cannot be negative"),
+        ]
+        for stat, value, message in cases:
+            stats = dict(valid, **{stat: value})
+            with pytest.raises(ValueError, match=message):
+                Monster(
+                    0, 0, "Bad", "b", monster_type="test", ai_behavior=AIBehavior.PASSIVE, **stats
+                )
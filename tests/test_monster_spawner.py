@@ -112,6 +112,17 @@ class TestMonsterSpawner:
         # Should have some different types at higher levels
         assert types_l10 != types_l1 or any(m.hp_max > 20 for m in monsters_l10)
 
+    def test_available_monster_types_match_level_ranges(self):
+        """Test the level window lookup matches each type's min/max levels."""
+        spawner = MonsterSpawner()
+        for level in range(1, 25):
+            expected = [
+                name
+                for name, info in MonsterSpawner.MONSTER_TYPES.items()
+                if info["min_level"] <= level <= info["max_level"]
+            ] or ["rat", "goblin"]
+            assert spawner._get_available_monster_types(level) == expected
+
     def test_spawn_with_no_valid_positions(self):
         """Test spawning handles case with no valid positions."""
         # Fill all room tiles
@@ -126,6 +137,30 @@ class TestMonsterSpawner:
         # Should return empty list or partial list
         assert len(monsters) == 0
 
+    def test_spawn_positions_cached_until_floor_changes(self):
+        """Test spawn positions are reused until the tiles or rooms change."""
+        first = self.floor.spawn_positions()
+        assert self.floor.spawn_positions() is first
+
+        # Wall off the first room and mark the floor changed
+        for x in range(self.room1.x, self.room1.x + self.room1.width):
+            for y in range(self.room1.y, self.room1.y + self.room1.height):
+                self.floor.tiles[(x, y)] = Tile(x, y, TileType.WALL)
+        self.floor.mark_tiles_changed()
+
+        positions = self.floor.spawn_positions()
+        assert len(positions) < len(first)
+        assert not any(self.room1.contains_point(x, y) for x, y in positions)
+
+        # Dropping a room is picked up without marking the tiles
+        self.floor.rooms.remove(self.room3)
+        positions = self.floor.spawn_positions()
+        assert not any(self.room3.contains_point(x, y) for x, y in positions)
+
+        self.floor.rooms = [self.room3]
+        positions = self.floor.spawn_positions()
+        assert positions and all(self.room3.contains_point(x, y) for x, y in positions)
+
     def test_spawn_excludes_player_position(self):
         """Test monsters don't spawn on player start position."""
         spawner = MonsterSpawner()
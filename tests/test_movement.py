@@ -22,12 +22,63 @@ class TestCharacter:
         assert char.stamina == 100
         assert char.stamina_max == 100
 
+    def test_character_core_stats_use_slots(self):
+        """Test core stats are slotted while extra attributes remain allowed."""
+        char = Character("Hero", 5, 5)
+        assert char.__dict__ == {}
+
+        char.dungeons_completed = 2
+        assert char.__dict__ == {}
+
+        char.portrait = "hero.png"
+        assert char.__dict__ == {"portrait": "hero.png"}
+
+    def test_character_status_effects_allocated_lazily(self):
+        """Test status effects start empty and fill in on first application."""
+        char = Character("Hero", 5, 5)
+        other = Character("Other", 1, 1)
+        assert char.status_effects == {}
+        assert "poisoned" not in char.status_effects
+
+        char.apply_status("poisoned", duration=3)
+        assert char.status_effects == {"poisoned": 3}
+        assert other.status_effects == {}
+
+    def test_character_status_effects_always_read_only(self):
+        """Test status effects are read-only whether or not any are active."""
+        char = Character("Hero", 5, 5)
+        with pytest.raises(TypeError):
+            char.status_effects["poisoned"] = 3
+
+        char.apply_status("poisoned", duration=3)
+        with pytest.raises(TypeError):
+            char.status_effects["poisoned"] = 5
+        assert char.status_effects == {"poisoned": 3}
+
+    def test_character_decrement_and_remove_status(self):
+        """Test status effects count down, expire and can be removed."""
+        char = Character("Hero", 5, 5)
+        char.apply_status("poisoned", duration=2)
+        char.apply_status("slowed", duration=4)
+
+        assert char.decrement_status("poisoned") == 1
+        assert char.decrement_status("poisoned") == 0
+        assert "poisoned" not in char.status_effects
+        assert char.decrement_status("poisoned") == 0
+
+        assert char.remove_status("slowed") is True
+        assert char.remove_status("slowed") is False
+        assert char.status_effects == {}
+
     def test_character_move_to(self):
         """Test moving character to new position."""
         char = Character("Hero", 5, 5)
         char.move_to((6, 5))
         assert char.position == (6, 5)
 
+        char.move_to_xy(7, 4)
+        assert char.position == (7, 4)
+
     def test_character_validate_move(self):
         """Test character move validation."""
         floor = Floor(seed=12345)
@@ -193,7 +244,7 @@ class TestKeyboardHandler:
     def test_keyboard_handler_creation(self):
         """Test creating keyboard handler."""
         handler = KeyboardHandler()
-        assert handler.command_queue == []
+        assert len(handler.command_queue) == 0
         assert handler.key_map is not None
 
     def test_key_mapping(self):
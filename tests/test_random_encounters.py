@@ -25,6 +25,10 @@ class TestRandomEncounters:
             encounter = encounters.generate_encounter(water_pos, TerrainType.WATER, haven_pos)
             assert encounter is None
 
+    def test_no_encounter_terrains_derived_from_weights(self):
+        """Test only zero-weight terrains are skipped before rolling."""
+        assert RandomEncounters._NO_ENCOUNTER_TERRAINS == frozenset({TerrainType.WATER})
+
     def test_encounter_generation_by_terrain(self, encounters):
         """Test encounters are generated based on terrain weights."""
         haven_pos = (37, 37)
@@ -3,7 +3,8 @@
 from collections import deque
 
 from src.enums import TileType
-from src.models.floor import Floor
+from src.models.floor import Floor, Room, _flood_fill
+from src.models.tile import Tile
 
 
 class TestRoomConnection:
@@ -51,6 +52,76 @@ class TestRoomConnection:
 
             assert floor.is_fully_connected(), f"Floor with seed {seed} is not fully connected"
 
+    def test_unconnected_rooms_detected(self):
+        """Test that rooms without corridors are reported as disconnected."""
+        floor = Floor(12345)
+        floor.generate()
+        assert len(floor.rooms) >= 2
+
+        assert floor.is_fully_connected() is False
+
+        floor.connect_rooms()
+        assert floor.is_fully_connected() is True
+
+    def test_connectivity_follows_direct_tile_changes(self):
+        """Test connectivity reflects tiles changed without marking the floor."""
+        floor = Floor(12345)
+        floor.generate()
+        floor.connect_rooms()
+        assert floor.is_fully_connected() is True
+
+        # Wall in the first room's center; the start check fails straight away
+        start = floor.rooms[0]
+        center = floor.tiles[(start.center_x, start.center_y)]
+        center.tile_type = TileType.WALL
+        assert floor.is_fully_connected() is False
+
+        # Wall in a whole room other than the first; the flood fill misses it
+        center.tile_type = TileType.FLOOR
+        room = floor.rooms[1]
+        for y in range(room.y, room.y2 + 1):
+            for x in range(room.x, room.x2 + 1):
+                floor.tiles[(x, y)] = Tile(x, y, TileType.WALL)
+        assert floor.is_fully_connected() is False
+
+    def test_connectivity_on_larger_floor(self):
+        """Test connectivity checks use the floor's own size, not the default."""
+        for seed in range(20):
+            floor = Floor(seed, width=30, height=30)
+            floor.generate()
+            floor.connect_rooms()
+
+            # Must not index past a default-sized plane
+            floor.is_fully_connected()
+            assert len(floor.walkable_mask()) == 30 * 30
+
+        # Rooms beyond the default 20x20 area are checked where they really are
+        floor = Floor(12345, width=30, height=30)
+        floor.rooms = [Room(22, 22, 4, 4), Room(22, 2, 4, 4)]
+        corridor = [(23, y) for y in range(6, 22)]
+        for room in floor.rooms:
+            for y in range(room.y, room.y2 + 1):
+                for x in range(room.x, room.x2 + 1):
+                    floor.tiles[(x, y)] = Tile(x, y, TileType.FLOOR)
+        for x, y in corridor:
+            floor.tiles[(x, y)] = Tile(x, y, TileType.FLOOR)
+        assert floor.is_fully_connected() is True
+
+        floor.tiles[corridor[5]].tile_type = TileType.WALL
+        floor.mark_tiles_changed()
+        assert floor.is_fully_connected() is False
+
+    def test_flood_fill_does_not_wrap_rows(self):
+        """Test the flood fill treats row ends as edges, not neighbors."""
+        # 3x3 grid: a walkable cell at the end of row 0 sits next to one at
+        # the start of row 1 in flat order, but they are not adjacent
+        walkable = bytearray([0, 1, 1, 1, 0, 0, 1, 1, 0])
+        reached = bytearray(9)
+
+        _flood_fill(walkable, 3, 2, reached)
+
+        assert reached == bytearray([0, 1, 1, 0, 0, 0, 0, 0, 0])
+
     def test_corridors_are_one_tile_wide(self):
         """Test that corridors are exactly 1 tile wide."""
         floor = Floor(12345)
@@ -163,6 +234,26 @@ class TestStairsPlacement:
 
         assert in_room, f"Stairs at {stairs_pos} are not inside any room"
 
+    def test_find_stairs(self):
+        """Test the stairs finders return the placed stairs positions."""
+        floor = Floor(12345)
+        floor.generate()
+        assert floor.find_stairs_up() is None
+        assert floor.find_stairs_down() is None
+
+        floor.connect_rooms()
+        floor.place_stairs()
+
+        up = floor.find_stairs_up()
+        down = floor.find_stairs_down()
+        assert floor.tiles[up].tile_type == TileType.STAIRS_UP
+        assert floor.tiles[down].tile_type == TileType.STAIRS_DOWN
+
+        # A retyped stairs tile is not reported from the remembered position
+        floor.tiles[up].tile_type = TileType.FLOOR
+        floor.mark_tiles_changed()
+        assert floor.find_stairs_up() is None
+
     def test_exactly_one_stairs(self):
         """Test that exactly one stairs is placed per floor."""
         floor = Floor(12345)
@@ -5,6 +5,7 @@ import pytest
 from src.enums import TileType
 from src.models.character import Character
 from src.models.floor import Floor
+from src.models.location import SafeHaven
 from src.models.safe_haven import EnhancedSafeHaven, SafeHavenInterior
 
 
@@ -51,6 +52,22 @@ class TestSafeHavenInterior:
                 assert tile is not None
                 assert tile.tile_type == TileType.FLOOR
 
+    def test_detailed_interiors_are_independent(self, interior):
+        """Test each interior is a separate floor even though the layout is cached."""
+        first = interior.create_detailed_interior()
+        second = interior.create_detailed_interior()
+
+        assert first is not second
+        first.tiles[(0, 0)].tile_type = TileType.FLOOR
+        assert second.tiles[(0, 0)].tile_type == TileType.WALL
+
+    def test_detailed_interior_matches_safe_haven_layout(self, interior):
+        """Test the detailed interior uses the same layout as the base Safe Haven."""
+        detailed = interior.create_detailed_interior()
+        basic = SafeHaven().create_interior()
+
+        assert detailed.build_tile_type_plane() == basic.build_tile_type_plane()
+
     def test_get_zone_at(self, interior):
         """Test zone lookup by position."""
         center_start = (Floor.FLOOR_WIDTH - 5) // 2
@@ -82,6 +99,14 @@ class TestSafeHavenInterior:
         assert not interior.is_in_safe_haven((center_end, center_end))
         assert not interior.is_in_safe_haven((0, 0))
 
+    def test_is_in_safe_haven_many(self, interior):
+        """Test the batch check matches the single-position check."""
+        positions = [(x, y) for x in range(5, 15) for y in range(5, 15)]
+
+        assert interior.is_in_safe_haven_many(positions) == [
+            interior.is_in_safe_haven(position) for position in positions
+        ]
+
     def test_no_combat_zone(self, interior):
         """Test combat is forbidden in Safe Haven."""
         character = Character("Test Hero", 10, 10)
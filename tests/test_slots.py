@@ -0,0 +1,30 @@
+"""Tests for the slotted classes created in bulk during floor and world generation."""
+
+import pytest
+
+from src.enums import ItemType, TerrainType, TileType
+from src.models.item import Item
+from src.models.monster import AIBehavior, Monster
+from src.models.tile import Tile
+from src.models.trap import Trap, TrapType
+from src.models.world_map import WorldTile
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        lambda: Monster(1, 1, "Rat", "r", 5, 5, 1, 0, "rat", AIBehavior.PASSIVE),
+        lambda: Item("Sword", ItemType.WEAPON),
+        lambda: Tile(0, 0, TileType.FLOOR),
+        lambda: Trap(x=5, y=5, trap_type=TrapType.SPIKE, damage=5, floor_level=1),
+        lambda: WorldTile(0, 0, TerrainType.PLAINS),
+    ],
+    ids=["monster", "item", "tile", "trap", "world_tile"],
+)
+def test_instances_have_no_dict(factory):
+    """Test instances keep only their slots and reject unknown attributes."""
+    instance = factory()
+
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.unexpected = 1
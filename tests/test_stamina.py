@@ -60,6 +60,14 @@ class TestCharacterStamina:
         char.stamina = 150
         assert char.stamina == 100
 
+    def test_stamina_clamped_after_max_lowered(self):
+        """Test that lowering stamina_max also caps the stamina read back."""
+        char = Character("Hero", 5, 5)
+        char.stamina = 80
+
+        char.stamina_max = 50
+        assert char.stamina == 50
+
 
 class TestStaminaSystem:
     """Tests for StaminaSystem class."""
@@ -109,6 +109,19 @@ class TestTrap:
         poison5 = Trap.create_scaled(x=0, y=0, trap_type=TrapType.POISON, floor_level=5)
         assert poison5.damage == 5  # 3 + (5-1)//2 = 5
 
+    def test_trap_create_scaled_batch(self):
+        """Test batch creation matches creating each trap with create_scaled."""
+        placements = [(1, 2, TrapType.SPIKE), (3, 4, TrapType.POISON), (5, 6, TrapType.ALARM)]
+
+        traps = Trap.create_scaled_batch(placements, floor_level=7)
+
+        for trap, (x, y, trap_type) in zip(traps, placements):
+            expected = Trap.create_scaled(x=x, y=y, trap_type=trap_type, floor_level=7)
+            assert trap.position == expected.position
+            assert trap.trap_type == expected.trap_type
+            assert trap.damage == expected.damage
+            assert trap.floor_level == 7
+
     def test_trap_render(self):
         """Test trap render display."""
         spike = Trap(x=0, y=0, trap_type=TrapType.SPIKE, damage=5, floor_level=1)
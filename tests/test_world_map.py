@@ -1,7 +1,7 @@
 """Tests for world map generation and functionality."""
 
 from src.enums import TerrainType
-from src.models.world_map import WorldMap, WorldTile
+from src.models.world_map import WorldMap, WorldTile, terrain_table
 
 
 class TestWorldTile:
@@ -228,3 +228,18 @@ class TestWorldMap:
         # Check tiles outside radius remain undiscovered
         assert world.tiles[30][30].discovered is False
         assert world.tiles[44][44].discovered is False
+
+    def test_vision_radius_table(self):
+        """Test vision radius lookups come from a terrain-indexed table."""
+        world = WorldMap(seed=42)
+        for terrain, radius in WorldMap.VISION_RADIUS_BY_TERRAIN.items():
+            assert world.get_vision_radius(terrain) == radius
+
+    def test_terrain_table_default_slot(self):
+        """Test terrain tables reserve slot 0 and missing terrains for the default."""
+        table = terrain_table({TerrainType.FOREST: 2}, 7)
+
+        assert len(table) == max(TerrainType) + 1
+        assert table[0] == 7
+        assert table[TerrainType.FOREST] == 2
+        assert table[TerrainType.WATER] == 7
@@ -6,7 +6,7 @@ from src.enums import TerrainType
 from src.game.world_navigation import WorldNavigation
 from src.models.character import Character
 from src.models.location import DungeonEntrance, SafeHaven
-from src.models.world_map import WorldMap
+from src.models.world_map import WorldMap, WorldTile
 
 
 class TestWorldNavigation:
@@ -49,6 +49,34 @@ class TestWorldNavigation:
                     assert world_nav.can_move_to(x, y) is False
                     return  # Found at least one water tile to test
 
+    def test_can_move_to_many(self, world_nav):
+        """Test bulk movement checks agree with single checks."""
+        positions = [(37, 37), (-1, 10), (74, 74), (75, 0)] + [(x, 20) for x in range(75)]
+        assert world_nav.can_move_to_many(positions) == [
+            world_nav.can_move_to(x, y) for x, y in positions
+        ]
+
+    def test_can_move_to_after_terrain_change(self):
+        """Test passability cache is refreshed when terrain is marked changed."""
+        nav = WorldNavigation(WorldMap())
+        assert nav.can_move_to(10, 10) is True
+
+        nav.world_map.tiles[10][10].terrain_type = TerrainType.WATER
+        nav.world_map.mark_terrain_changed()
+        assert nav.can_move_to(10, 10) is False
+
+    def test_passable_mask_follows_tile_rule(self, monkeypatch):
+        """Test the passability mask uses WorldTile.is_passable, not its own rule."""
+        world_map = WorldMap(seed=42)
+        world_map.tiles[10][10].terrain_type = TerrainType.FOREST
+        monkeypatch.setattr(
+            WorldTile, "is_passable", lambda tile: tile.terrain_type != TerrainType.FOREST
+        )
+
+        nav = WorldNavigation(world_map)
+        assert nav.can_move_to(10, 10) is False
+        assert nav.can_move_to(11, 10) is True
+
     def test_distance_calculations(self):
         """Test distance calculation methods."""
         nav = WorldNavigation(WorldMap())
@@ -57,11 +85,39 @@ class TestWorldNavigation:
         assert nav.calculate_distance((0, 0), (3, 4)) == 5.0  # 3-4-5 triangle
         assert nav.calculate_distance((10, 10), (10, 10)) == 0.0  # Same position
 
+        # Squared distance for radius comparisons
+        assert nav.calculate_distance_sq((0, 0), (3, 4)) == 25
+        assert nav.calculate_distance_sq((5, 5), (2, 1)) == 25
+
         # Manhattan distance
         assert nav.calculate_manhattan_distance((0, 0), (3, 4)) == 7
         assert nav.calculate_manhattan_distance((10, 10), (10, 10)) == 0
         assert nav.calculate_manhattan_distance((5, 5), (8, 9)) == 7  # |8-5| + |9-5|
 
+    def test_terrain_tables_match_dicts(self):
+        """Test indexed terrain tables agree with the per-terrain dicts."""
+        nav = WorldNavigation(WorldMap())
+
+        for terrain in TerrainType:
+            assert nav.get_movement_cost(terrain) == nav.MOVEMENT_COSTS[terrain]
+            assert nav.get_vision_radius(terrain) == nav.VISION_RADIUS[terrain]
+
+        # Unknown terrain falls back to the defaults in slot 0
+        assert nav.get_movement_cost(None) == 1.0  # type: ignore
+        assert nav.get_vision_radius(None) == 3  # type: ignore
+
+    def test_terrain_grids_match_single_lookups(self, world_nav):
+        """Test whole-map cost and vision grids agree with per-tile lookups."""
+        costs = world_nav.movement_cost_grid()
+        radii = world_nav.vision_radius_grid()
+
+        assert len(costs) == WorldMap.HEIGHT
+        for row in world_nav.world_map.tiles:
+            for tile in row:
+                terrain = tile.terrain_type
+                assert costs[tile.y][tile.x] == world_nav.get_movement_cost(terrain)
+                assert radii[tile.y][tile.x] == world_nav.get_vision_radius(terrain)
+
     def test_vision_radius(self):
         """Test vision radius by terrain."""
         nav = WorldNavigation(WorldMap())
@@ -120,6 +176,7 @@ class TestWorldNavigation:
 
         assert dungeon.discovered is True
         assert dungeon.position in nav.discovered_locations
+        assert char.discovered_locations == {dungeon.position}
 
     def test_find_nearby_locations(self):
         """Test finding locations within radius."""
@@ -138,6 +195,16 @@ class TestWorldNavigation:
         assert locations[1] in nearby
         assert locations[2] not in nearby
 
+    def test_find_nearby_locations_includes_radius_edge(self):
+        """Test locations exactly on the radius are included."""
+        nav = WorldNavigation(WorldMap())
+
+        edge = DungeonEntrance((40, 41), "Edge", 1, 9, 3)  # 3-4-5 triangle
+        beyond = DungeonEntrance((41, 41), "Beyond", 1, 9, 3)
+
+        nearby = nav.find_nearby_locations((37, 37), 5, [edge, beyond])
+        assert nearby == [edge]
+
     def test_check_location_discovery(self):
         """Test automatic location discovery."""
         nav = WorldNavigation(WorldMap())
@@ -173,3 +240,12 @@ class TestWorldNavigation:
         char2 = Character("Hero2", 10, 10)
         can_enter, reason = nav.can_enter_location(char2, haven)
         assert can_enter is False
+
+    def test_character_world_position_reset(self):
+        """Test clearing world_position falls back to the current position."""
+        char = Character("Hero", 5, 6)
+        char.world_position = (37, 37)
+        assert char.world_position == (37, 37)
+
+        char.world_position = None
+        assert char.world_position == (5, 6)